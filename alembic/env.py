@@ -12,7 +12,8 @@ from app.config import settings
 from app.models.platform import Platform
 from app.models.action import Action
 from app.models.variable import Variable
-from app.models.template import Template
+from app.models.template import Template, TemplateVersion
+from app.models.conversion_log import ConversionLog
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
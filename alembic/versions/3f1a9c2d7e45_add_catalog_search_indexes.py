@@ -0,0 +1,41 @@
+"""Add catalog full-text search indexes
+
+Revision ID: 3f1a9c2d7e45
+Revises: 7be4ab9f6447
+Create Date: 2026-10-19 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1a9c2d7e45'
+down_revision: Union[str, Sequence[str], None] = '7be4ab9f6447'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match the expressions used by app.core.search so the planner picks the indexes
+NAME_DESCRIPTION_DOCUMENT = "to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))"
+TEMPLATE_DOCUMENT = "to_tsvector('english', content)"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # tsvector GIN indexes are Postgres-only; other databases use the in-process index
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute(f"CREATE INDEX ix_platforms_search ON platforms USING gin ({NAME_DESCRIPTION_DOCUMENT})")
+    op.execute(f"CREATE INDEX ix_actions_search ON actions USING gin ({NAME_DESCRIPTION_DOCUMENT})")
+    op.execute(f"CREATE INDEX ix_templates_search ON templates USING gin ({TEMPLATE_DOCUMENT})")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index('ix_templates_search', table_name='templates')
+    op.drop_index('ix_actions_search', table_name='actions')
+    op.drop_index('ix_platforms_search', table_name='platforms')
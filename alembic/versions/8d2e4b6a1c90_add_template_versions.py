@@ -0,0 +1,60 @@
+"""Add immutable template versions
+
+Revision ID: 8d2e4b6a1c90
+Revises: 3f1a9c2d7e45
+Create Date: 2026-10-19 10:03:17.552061
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d2e4b6a1c90'
+down_revision: Union[str, Sequence[str], None] = '3f1a9c2d7e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('template_versions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('action_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.Integer(), nullable=False),
+    sa.Column('content', sqlmodel.sql.sqltypes.AutoString(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['action_id'], ['actions.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('action_id', 'version')
+    )
+    op.create_index(op.f('ix_template_versions_action_id'), 'template_versions', ['action_id'], unique=False)
+    op.add_column('templates', sa.Column('active_version_id', sa.Integer(), nullable=True))
+    if op.get_bind().dialect.name != "sqlite":
+        op.create_foreign_key(
+            'templates_active_version_id_fkey', 'templates', 'template_versions',
+            ['active_version_id'], ['id']
+        )
+
+    # Existing template content becomes version 1 of each action
+    op.execute(
+        "INSERT INTO template_versions (action_id, version, content, created_at) "
+        "SELECT action_id, 1, content, updated_at FROM templates"
+    )
+    op.execute(
+        "UPDATE templates SET active_version_id = ("
+        "SELECT v.id FROM template_versions v WHERE v.action_id = templates.action_id AND v.version = 1)"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "sqlite":
+        op.drop_constraint('templates_active_version_id_fkey', 'templates', type_='foreignkey')
+    op.drop_column('templates', 'active_version_id')
+    op.drop_index(op.f('ix_template_versions_action_id'), table_name='template_versions')
+    op.drop_table('template_versions')
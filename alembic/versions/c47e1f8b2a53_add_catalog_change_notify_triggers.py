@@ -0,0 +1,51 @@
+"""Add catalog change NOTIFY triggers
+
+Revision ID: c47e1f8b2a53
+Revises: 8d2e4b6a1c90
+Create Date: 2026-10-19 11:26:48.903415
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c47e1f8b2a53'
+down_revision: Union[str, Sequence[str], None] = '8d2e4b6a1c90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+CATALOG_TABLES = ['platforms', 'actions', 'variables', 'templates']
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # LISTEN/NOTIFY is Postgres-only; other databases rely on in-process notifications
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("""
+        CREATE OR REPLACE FUNCTION notify_catalog_change() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('catalog_changes', json_build_object('table', TG_TABLE_NAME, 'op', TG_OP)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    # Statement-level triggers send one notification per write statement, not per row
+    for table in CATALOG_TABLES:
+        op.execute(
+            f"CREATE TRIGGER {table}_notify_catalog_change "
+            f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION notify_catalog_change()"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    for table in CATALOG_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_notify_catalog_change ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS notify_catalog_change()")
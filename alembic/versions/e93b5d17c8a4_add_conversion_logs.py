@@ -0,0 +1,44 @@
+"""Add conversion log
+
+Revision ID: e93b5d17c8a4
+Revises: c47e1f8b2a53
+Create Date: 2026-10-19 14:41:09.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e93b5d17c8a4'
+down_revision: Union[str, Sequence[str], None] = 'c47e1f8b2a53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('conversion_logs',
+    sa.Column('id', sa.BigInteger().with_variant(sa.Integer(), 'sqlite'), nullable=False),
+    sa.Column('platform_id', sa.Integer(), nullable=False),
+    sa.Column('action_id', sa.Integer(), nullable=False),
+    sa.Column('variables_hash', sqlmodel.sql.sqltypes.AutoString(length=64), nullable=False),
+    sa.Column('prompt_chars', sa.Integer(), nullable=False),
+    sa.Column('latency_ms', sa.Float(), nullable=False),
+    sa.Column('source', sqlmodel.sql.sqltypes.AutoString(length=16), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_conversion_logs_action_id'), 'conversion_logs', ['action_id'], unique=False)
+    op.create_index(op.f('ix_conversion_logs_created_at'), 'conversion_logs', ['created_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_conversion_logs_created_at'), table_name='conversion_logs')
+    op.drop_index(op.f('ix_conversion_logs_action_id'), table_name='conversion_logs')
+    op.drop_table('conversion_logs')
@@ -1,9 +1,19 @@
-from typing import Generator
-from sqlmodel import Session
-from app.database import engine
+import secrets
+from typing import Optional
+from fastapi import Header, HTTPException
+from app.config import settings
+from app.database import get_read_session, get_session
 
+__all__ = ["get_session", "get_read_session", "require_admin"]
 
-def get_session() -> Generator[Session, None, None]:
-    """Dependency to get database session"""
-    with Session(engine) as session:
-        yield session
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)) -> None:
+    """Dependency that rejects requests without the configured admin token"""
+    if not settings.admin_token:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    # Compare bytes: compare_digest rejects str with non-ASCII characters, and Starlette
+    # decodes header values as Latin-1, so this recovers the bytes the client sent
+    if not x_admin_token or not secrets.compare_digest(
+        x_admin_token.encode("latin-1"), settings.admin_token.encode()
+    ):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
@@ -0,0 +1,119 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Type
+from fastapi import HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from sqlalchemy import and_, or_
+from sqlmodel import Session, SQLModel, select
+from app.config import settings
+
+
+class PageParams:
+    """Keyset pagination and field projection query parameters"""
+
+    def __init__(
+        self,
+        request: Request,
+        limit: int = Query(
+            default=settings.page_size_default, ge=1, le=settings.page_size_max,
+            description="Maximum number of items to return"
+        ),
+        after: Optional[str] = Query(
+            default=None,
+            description="Cursor from the previous page's X-Next-Cursor header"
+        ),
+        fields: Optional[str] = Query(
+            default=None,
+            description="Comma-separated fields to return, e.g. `id,name,slug`"
+        ),
+    ):
+        self.request = request
+        self.limit = limit
+        self.after = after
+        self.fields = fields
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode the sort key of the last row of a page as an opaque cursor"""
+    return base64.urlsafe_b64encode(json.dumps(list(values)).encode()).decode()
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """Decode a cursor produced by encode_cursor"""
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def parse_fields(fields: Optional[str], read_model: Type[SQLModel]) -> Optional[List[str]]:
+    """Validate a comma-separated field list against a read model"""
+    if not fields:
+        return None
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in read_model.model_fields]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return requested
+
+
+def _after(order_by: Sequence[Any], values: Sequence[Any]):
+    """Build a keyset predicate selecting rows strictly after the cursor"""
+    clauses = []
+    for i, column in enumerate(order_by):
+        equal = [order_by[j] == values[j] for j in range(i)]
+        clauses.append(and_(*equal, column > values[i]))
+    return or_(*clauses)
+
+
+def paginate(
+    session: Session,
+    model: Type[SQLModel],
+    read_model: Type[SQLModel],
+    criteria: Sequence[Any],
+    order_by: Sequence[Any],
+    params: PageParams,
+    response: Response,
+):
+    """
+    Fetch one page of rows ordered by a unique key
+
+    Only `limit + 1` rows are loaded. When more rows exist, the cursor for the
+    next page is returned in the X-Next-Cursor and Link headers. With
+    `fields`, only the requested columns are selected.
+    """
+    fields = parse_fields(params.fields, read_model)
+    key_names = [column.key for column in order_by]
+
+    if fields:
+        columns = fields + [name for name in key_names if name not in fields]
+        statement = select(*[getattr(model, name) for name in columns])
+    else:
+        statement = select(model)
+
+    statement = statement.where(*criteria)
+    if params.after:
+        statement = statement.where(_after(order_by, decode_cursor(params.after, len(order_by))))
+    statement = statement.order_by(*order_by).limit(params.limit + 1)
+
+    rows = session.exec(statement).all()
+    has_more = len(rows) > params.limit
+    rows = rows[:params.limit]
+
+    headers = {}
+    if has_more:
+        cursor = encode_cursor([getattr(rows[-1], name) for name in key_names])
+        next_url = params.request.url.include_query_params(after=cursor)
+        headers["X-Next-Cursor"] = cursor
+        headers["Link"] = f'<{next_url}>; rel="next"'
+
+    if fields:
+        content = [{name: getattr(row, name) for name in fields} for row in rows]
+        return JSONResponse(content=jsonable_encoder(content), headers=headers)
+
+    response.headers.update(headers)
+    return rows
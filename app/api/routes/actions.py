@@ -1,47 +1,142 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from typing import List
-from app.api.deps import get_session
-from app.models import Action, ActionRead, ActionReadWithVariables, Variable, VariableRead
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+from fastapi.responses import JSONResponse
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session
+from typing import List, Optional
+from app.api.deps import get_read_session, get_session, require_admin
+from app.api.pagination import PageParams, paginate
+from app.config import settings
+from app.core import catalog, statements
+from app.core.json_schema import build_action_schema
+from app.core.template_cache import compiled_templates
+from app.models import (
+    ActionReadWithVariables, Variable, VariableRead,
+    TemplateVersionCreate, TemplateVersionRead
+)
+from app.services.templates import activate_template_version, list_template_versions, publish_template
 
 router = APIRouter()
 
 
 @router.get("/{action_id}", response_model=ActionReadWithVariables)
-def get_action(
-    action_id: int,
-    session: Session = Depends(get_session)
-):
+def get_action(action_id: int):
     """Get action by ID with its variables"""
-    statement = select(Action).where(Action.id == action_id)
-    action = session.exec(statement).first()
+    action = catalog.get_action_detail(action_id)
     
     if not action:
         raise HTTPException(status_code=404, detail="Action not found")
     
-    # Get action variables
-    variables_statement = select(Variable).where(Variable.action_id == action_id).order_by(Variable.order)
-    variables = session.exec(variables_statement).all()
-    
-    # Convert to response model
-    action_data = action.model_dump()
-    action_data["variables"] = [VariableRead.model_validate(var) for var in variables]
-    
-    return ActionReadWithVariables.model_validate(action_data)
+    return action
 
 
 @router.get("/{action_id}/variables", response_model=List[VariableRead])
 def get_action_variables(
     action_id: int,
-    session: Session = Depends(get_session)
+    response: Response,
+    page: PageParams = Depends(),
+    session: Session = Depends(get_read_session)
 ):
-    """Get all variables for a specific action"""
+    """Get variables for a specific action, one page at a time in display order"""
     # Verify action exists
-    action = session.exec(select(Action).where(Action.id == action_id)).first()
-    if not action:
+    action = session.exec(statements.ACTION_EXISTS, params={"action_id": action_id}).first()
+    if action is None:
         raise HTTPException(status_code=404, detail="Action not found")
     
-    # Get variables ordered by display order
-    statement = select(Variable).where(Variable.action_id == action_id).order_by(Variable.order)
-    variables = session.exec(statement).all()
-    return variables
+    # Get variables ordered by display order, with ID as the tie-breaker
+    criteria = [Variable.action_id == action_id]
+    return paginate(session, Variable, VariableRead, criteria, [Variable.order, Variable.id], page, response)
+
+
+@router.get("/{action_id}/schema")
+def get_action_schema(
+    action_id: int,
+    request: Request,
+    if_none_match: Optional[str] = Header(default=None)
+):
+    """
+    Get a JSON Schema for the action's `variables` object
+
+    The schema encodes the same rules as `/convert/validate` so clients can
+    validate locally. Responses carry an ETag; send it back in If-None-Match
+    to get a 304 when the variable definitions are unchanged.
+    """
+    def build():
+        action = catalog.get_action(action_id)
+        if not action:
+            return None
+        # A host-relative $id: the cached schema and its ETag are shared by every host and worker
+        schema_id = request.app.url_path_for("get_action_schema", action_id=action_id)
+        return build_action_schema(action, catalog.get_variables(action_id), schema_id)
+
+    built = catalog.catalog_cache.get_or_load(f"schema:{action_id}", build)
+    if not built:
+        raise HTTPException(status_code=404, detail="Action not found")
+
+    schema, etag = built
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.schema_cache_max_age}",
+    }
+    if if_none_match and etag in {tag.strip() for tag in if_none_match.split(",")}:
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=schema, media_type="application/schema+json", headers=headers)
+
+
+@router.get(
+    "/{action_id}/template/versions",
+    response_model=List[TemplateVersionRead],
+    dependencies=[Depends(require_admin)]
+)
+def get_template_versions(
+    action_id: int,
+    session: Session = Depends(get_session)
+):
+    """List the action's template versions, newest first"""
+    return list_template_versions(session, action_id)
+
+
+@router.post(
+    "/{action_id}/template/versions",
+    response_model=TemplateVersionRead,
+    status_code=201,
+    dependencies=[Depends(require_admin)]
+)
+def create_template_version(
+    action_id: int,
+    request: TemplateVersionCreate,
+    session: Session = Depends(get_session)
+):
+    """Publish new template content as the action's active version"""
+    action = session.exec(statements.ACTION_EXISTS, params={"action_id": action_id}).first()
+    if action is None:
+        raise HTTPException(status_code=404, detail="Action not found")
+
+    from jinja2 import TemplateSyntaxError
+
+    # Refuse content that would fail every conversion
+    try:
+        compiled_templates.environment.parse(request.content)
+    except TemplateSyntaxError as e:
+        raise HTTPException(status_code=422, detail=f"Template syntax error: {e}")
+
+    try:
+        return publish_template(session, action_id, request.content)
+    except IntegrityError:
+        raise HTTPException(status_code=409, detail="Concurrent template publishes conflicted, retry")
+
+
+@router.post(
+    "/{action_id}/template/versions/{version_id}/activate",
+    response_model=TemplateVersionRead,
+    dependencies=[Depends(require_admin)]
+)
+def activate_template(
+    action_id: int,
+    version_id: int,
+    session: Session = Depends(get_session)
+):
+    """Switch the action back (or forward) to an existing template version"""
+    version = activate_template_version(session, action_id, version_id)
+    if not version:
+        raise HTTPException(status_code=404, detail="Template version not found")
+    return version
@@ -0,0 +1,73 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import PlainTextResponse
+from typing import Any, Dict, List
+from app.api.deps import require_admin
+from app.core import catalog
+from app.core.admission import admission_limiters
+from app.core.hotset import hot_set
+from app.core.profiling import profile_store
+from app.database import read_router
+from app.services.conversion_log import conversion_log
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+
+@router.get("/profiles")
+def list_profiles() -> List[Dict[str, Any]]:
+    """List the most recent request profiles, newest first"""
+    return profile_store.list()
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+def download_profile(profile_id: str):
+    """Download a profile as collapsed stacks for flamegraph.pl or speedscope"""
+    collapsed = profile_store.collapsed(profile_id)
+    if collapsed is None:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="profile-{profile_id}.collapsed"'}
+    )
+
+
+@router.get("/caches")
+def cache_stats() -> Dict[str, Any]:
+    """Entry counts and hit/miss counters of this worker's caches"""
+    return {
+        "catalog": catalog.catalog_cache.stats(),
+        "templates": catalog.template_cache.stats(),
+        "renders": catalog.render_cache.stats(),
+    }
+
+
+@router.get("/admission")
+def admission_stats() -> Dict[str, Any]:
+    """Concurrency, queue depth and reject counters of this worker's admission limiters"""
+    return {name: limiter.stats() for name, limiter in admission_limiters.items()}
+
+
+@router.get("/conversion-log")
+def conversion_log_stats() -> Dict[str, Any]:
+    """Buffer depth and written/dropped/failed row counts of this worker's conversion log writer"""
+    return conversion_log.stats()
+
+
+@router.get("/replicas")
+def replica_stats() -> Dict[str, Any]:
+    """Health and lag of each read replica as last checked by this worker"""
+    return read_router.stats()
+
+
+@router.get("/hotset")
+def hotset_ranking(limit: int = Query(default=20, ge=1, le=1000)) -> List[Dict[str, Any]]:
+    """This worker's hottest actions by decayed conversion count, hottest first"""
+    ranking = []
+    for action_id, score in hot_set.top(limit):
+        action = catalog.get_action(action_id)
+        ranking.append({
+            "action_id": action_id,
+            "action": action.slug if action else None,
+            "platform_id": action.platform_id if action else None,
+            "score": round(score, 3),
+        })
+    return ranking
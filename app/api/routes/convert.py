@@ -1,32 +1,86 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
-from app.api.deps import get_session
+import json
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Set, Tuple
+from fastapi import APIRouter, HTTPException, Header, Query
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from app.config import settings
+from app.core import catalog
 from app.core.converter import PromptConverter
-from app.schemas.convert import ConvertRequest, ConvertResponse, ErrorResponse
-from app.models import Platform, Action
+from app.core.hotset import hot_set
+from app.core.singleflight import SingleFlight, request_key
+from app.core.slug_index import slug_index
+from app.services.conversion_log import conversion_log
+from app.schemas.convert import ConvertRequest, ConvertResponse, ErrorResponse, ExpandRequest, ValidationError
 
 router = APIRouter()
 
+# Concurrent identical conversions share one DB + render pass
+convert_flight = SingleFlight()
 
-@router.post("/", response_model=ConvertResponse)
-def convert_to_prompt(
-    request: ConvertRequest,
-    session: Session = Depends(get_session)
-):
-    """
-    Convert platform + action + variables to a final prompt
-    """
-    # Initialize converter
-    converter = PromptConverter(session)
-    
-    # Get platform and action names for response
-    platform = session.exec(select(Platform).where(Platform.id == request.platform_id)).first()
-    action = session.exec(select(Action).where(Action.id == request.action_id)).first()
+
+def _resolve_ids(request: ConvertRequest) -> None:
+    """Fill in platform/action IDs from slugs using the slug index"""
+    if request.platform_id is None:
+        request.platform_id = slug_index.platform_id(request.platform_slug)
+    if request.action_id is None and request.platform_id is not None:
+        request.action_id = slug_index.action_id(request.platform_id, request.action_slug)
+
+
+def _parse_fields(fields: Optional[str]) -> Optional[Set[str]]:
+    """Parse the `fields` query parameter, rejecting unknown names before any work is done"""
+    if not fields:
+        return None
+
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(ConvertResponse.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown response fields: {', '.join(sorted(unknown))}"
+        )
+    return requested
+
+
+def _shape_response(response: ConvertResponse, requested: Optional[Set[str]], accept: Optional[str]):
+    """Trim a convert response to the requested fields or plain prompt text"""
+    if accept and "text/plain" in accept and "application/json" not in accept:
+        return PlainTextResponse(response.prompt)
+
+    if not requested:
+        return response
+
+    return JSONResponse(content=response.model_dump(include=requested))
+
+
+def _get_names(request: ConvertRequest):
+    """Get the platform and action named in the response, or 404"""
+    platform = catalog.get_platform(request.platform_id)
+    action = catalog.get_action(request.action_id)
     
     if not platform:
         raise HTTPException(status_code=404, detail="Platform not found")
     if not action:
         raise HTTPException(status_code=404, detail="Action not found")
+    return platform, action
+
+
+def _raise_validation_failed(validation_errors: List[ValidationError]) -> None:
+    raise HTTPException(
+        status_code=422,
+        detail=ErrorResponse(
+            detail="Validation failed",
+            errors=validation_errors
+        ).model_dump()
+    )
+
+
+def _convert(request: ConvertRequest) -> ConvertResponse:
+    """Look up the platform/action and render the prompt for a resolved request"""
+    # Initialize converter
+    converter = PromptConverter()
+    
+    # Get platform and action names for response
+    platform, action = _get_names(request)
     
     # Convert to prompt
     prompt, validation_errors = converter.convert_to_prompt(
@@ -37,15 +91,8 @@ def convert_to_prompt(
     
     # Handle validation errors
     if validation_errors:
-        raise HTTPException(
-            status_code=422,
-            detail=ErrorResponse(
-                detail="Validation failed",
-                errors=validation_errors
-            ).model_dump()
-        )
+        _raise_validation_failed(validation_errors)
     
-    # Return successful response
     return ConvertResponse(
         prompt=prompt,
         platform=platform.name,
@@ -54,15 +101,137 @@ def convert_to_prompt(
     )
 
 
-@router.post("/validate")
-def validate_variables(
+async def _logged_chunks(chunks: AsyncIterator[str], request: ConvertRequest, started: float) -> AsyncIterator[str]:
+    """Pass chunks through, then record the streamed prompt in the conversion log"""
+    size = 0
+    async for chunk in chunks:
+        size += len(chunk)
+        yield chunk
+    conversion_log.record(
+        request.platform_id, request.action_id, request.variables,
+        size, time.perf_counter() - started, "stream", wait=False
+    )
+
+
+def _stream(request: ConvertRequest, started: float) -> StreamingResponse:
+    """Validate a resolved request and stream its prompt while it renders"""
+    _get_names(request)
+    
+    chunks, validation_errors = PromptConverter().stream_prompt(
+        request.platform_id,
+        request.action_id,
+        request.variables
+    )
+    if validation_errors:
+        _raise_validation_failed(validation_errors)
+    
+    return StreamingResponse(_logged_chunks(chunks, request, started), media_type="text/plain; charset=utf-8")
+
+
+@router.post("/", response_model=ConvertResponse)
+def convert_to_prompt(
     request: ConvertRequest,
-    session: Session = Depends(get_session)
+    fields: Optional[str] = Query(
+        default=None,
+        description="Comma-separated response fields to return, e.g. `prompt,platform,action`"
+    ),
+    stream: bool = Query(
+        default=False,
+        description="Stream the prompt as text/plain chunks while it renders"
+    ),
+    accept: Optional[str] = Header(default=None)
 ):
+    """
+    Convert platform + action + variables to a final prompt
+
+    Send `Accept: text/plain` to receive only the prompt text, or use `fields`
+    to drop fields such as `variables_used` from the JSON body. With
+    `stream=1` the prompt text is sent as it renders; validation errors are
+    still reported as a 422 before any output.
+
+    Lookups are served from the catalog caches; a database connection is
+    only checked out on a cache miss.
+    """
+    started = time.perf_counter()
+    requested = _parse_fields(fields)
+    _resolve_ids(request)
+    if request.action_id is not None:
+        hot_set.record(request.action_id)
+
+    if stream:
+        return _stream(request, started)
+
+    if settings.convert_singleflight_enabled:
+        key = request_key(request.platform_id, request.action_id, request.variables)
+        response = convert_flight.do(key, lambda: _convert(request))
+    else:
+        response = _convert(request)
+
+    conversion_log.record(
+        request.platform_id, request.action_id, request.variables,
+        len(response.prompt), time.perf_counter() - started, "api"
+    )
+    return _shape_response(response, requested, accept)
+
+
+def _expanded_lines(
+    prompts: Iterator[Tuple[Dict[str, str], str, List[ValidationError]]],
+    request: ExpandRequest,
+    started: float
+) -> Iterator[str]:
+    """Serialize each rendered combination as an NDJSON line and record it in the conversion log"""
+    for combination, prompt, errors in prompts:
+        if errors:
+            yield json.dumps({"variables": combination, "errors": [error.model_dump() for error in errors]}) + "\n"
+        else:
+            yield json.dumps({"variables": combination, "prompt": prompt}) + "\n"
+            conversion_log.record(
+                request.platform_id, request.action_id, {**request.variables, **combination},
+                len(prompt), time.perf_counter() - started, "expand"
+            )
+        started = time.perf_counter()
+
+
+@router.post("/expand")
+def expand_to_prompts(request: ExpandRequest):
+    """
+    Render a prompt for every combination of the options of the `expand` select variables
+
+    Other variables take their fixed values from `variables`. Validation
+    errors, or more combinations than the configured cap, are reported as a
+    422 before any output. Prompts are then streamed as NDJSON lines of
+    `{"variables", "prompt"|"errors"}`, rendered one at a time as they are
+    sent; `X-Combination-Count` carries the total.
+    """
+    started = time.perf_counter()
+    _resolve_ids(request)
+    _get_names(request)
+    hot_set.record(request.action_id)
+
+    prompts, count, validation_errors = PromptConverter().expand_prompts(
+        request.platform_id,
+        request.action_id,
+        request.variables,
+        request.expand,
+        settings.convert_expand_max_combinations
+    )
+    if validation_errors:
+        _raise_validation_failed(validation_errors)
+
+    return StreamingResponse(
+        _expanded_lines(prompts, request, started),
+        media_type="application/x-ndjson",
+        headers={"X-Combination-Count": str(count)}
+    )
+
+
+@router.post("/validate")
+def validate_variables(request: ConvertRequest):
     """
     Validate variables without generating prompt
     """
-    converter = PromptConverter(session)
+    converter = PromptConverter()
+    _resolve_ids(request)
     
     # Just run validation
     _, validation_errors = converter.convert_to_prompt(
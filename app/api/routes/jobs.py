@@ -0,0 +1,46 @@
+from fastapi import APIRouter, File, HTTPException, UploadFile
+from fastapi.responses import FileResponse
+from app.schemas.jobs import JobRead
+from app.services.jobs import job_queue, submit_job
+
+router = APIRouter()
+
+
+@router.post("/", response_model=JobRead, status_code=202)
+def create_job(file: UploadFile = File(description="NDJSON file with one convert request per line")):
+    """
+    Queue a bulk conversion job
+
+    Each line is a `/convert` request body. Poll `GET /convert/jobs/{id}` for
+    progress, then download one result line per request from `/results`.
+    """
+    try:
+        job = submit_job(job_queue, file.file)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return job.read()
+
+
+@router.get("/{job_id}", response_model=JobRead)
+def get_job(job_id: str):
+    """Get a job's status and progress"""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job.read()
+
+
+@router.get("/{job_id}/results")
+def download_job_results(job_id: str):
+    """
+    Download a completed job's results as NDJSON
+
+    Lines are `{"line": n, "prompt": ...}` or `{"line": n, "errors": [...]}`,
+    where `n` is the request's line number in the upload.
+    """
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Job is {job.status}")
+    return FileResponse(job.output_path, media_type="application/x-ndjson", filename=f"job-{job.id}.ndjson")
@@ -1,44 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlmodel import Session
 from typing import List
-from app.api.deps import get_session
-from app.models import Platform, PlatformRead, PlatformReadWithActions, Action, ActionRead
+from app.api.deps import get_read_session
+from app.api.pagination import PageParams, encode_cursor, paginate
+from app.config import settings
+from app.api.routes.actions import get_action
+from app.core import statements
+from app.core.slug_index import slug_index
+from app.models import Platform, PlatformRead, PlatformReadWithActions, Action, ActionRead, ActionReadWithVariables
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[PlatformRead])
 def get_platforms(
+    response: Response,
     active_only: bool = True,
-    session: Session = Depends(get_session)
+    page: PageParams = Depends(),
+    session: Session = Depends(get_read_session)
 ):
-    """Get all platforms"""
-    statement = select(Platform)
-    if active_only:
-        statement = statement.where(Platform.is_active == True)
-    
-    platforms = session.exec(statement).all()
-    return platforms
+    """Get platforms, one page at a time ordered by ID"""
+    criteria = [Platform.is_active == True] if active_only else []
+    return paginate(session, Platform, PlatformRead, criteria, [Platform.id], page, response)
+
+
+@router.get("/by-slug/{slug}", response_model=PlatformReadWithActions)
+def get_platform_by_slug(
+    slug: str,
+    response: Response,
+    include_actions: bool = True,
+    session: Session = Depends(get_read_session)
+):
+    """Get platform by slug with its actions"""
+    platform_id = slug_index.platform_id(slug)
+    if platform_id is None:
+        raise HTTPException(status_code=404, detail="Platform not found")
+    return get_platform(platform_id, response, include_actions, session)
+
+
+@router.get("/by-slug/{slug}/actions/{action_slug}", response_model=ActionReadWithVariables)
+def get_platform_action_by_slug(
+    slug: str,
+    action_slug: str
+):
+    """Get a platform's action by slug with its variables"""
+    platform_id = slug_index.platform_id(slug)
+    action_id = slug_index.action_id(platform_id, action_slug) if platform_id is not None else None
+    if action_id is None:
+        raise HTTPException(status_code=404, detail="Action not found")
+    return get_action(action_id)
 
 
 @router.get("/{platform_id}", response_model=PlatformReadWithActions)
 def get_platform(
     platform_id: int,
-    session: Session = Depends(get_session)
+    response: Response,
+    include_actions: bool = True,
+    session: Session = Depends(get_read_session)
 ):
-    """Get platform by ID with its actions"""
-    statement = select(Platform).where(Platform.id == platform_id)
-    platform = session.exec(statement).first()
+    """
+    Get platform by ID with its actions
+
+    At most `PAGE_SIZE_MAX` actions are embedded. When there are more, the
+    X-Next-Actions-Cursor header continues the listing on `/{platform_id}/actions`.
+    """
+    platform = session.exec(statements.PLATFORM_ENTITY_BY_ID, params={"platform_id": platform_id}).first()
     
     if not platform:
         raise HTTPException(status_code=404, detail="Platform not found")
     
     # Get platform actions
-    actions_statement = select(Action).where(
-        Action.platform_id == platform_id,
-        Action.is_active == True
-    )
-    actions = session.exec(actions_statement).all()
+    actions = []
+    if include_actions:
+        actions = session.exec(
+            statements.ACTIVE_PLATFORM_ACTIONS,
+            params={"platform_id": platform_id, "limit": settings.page_size_max + 1}
+        ).all()
+        if len(actions) > settings.page_size_max:
+            actions = actions[:settings.page_size_max]
+            response.headers["X-Next-Actions-Cursor"] = encode_cursor([actions[-1].id])
     
     # Convert to response model
     platform_data = platform.model_dump()
@@ -50,19 +90,20 @@ def get_platform(
 @router.get("/{platform_id}/actions", response_model=List[ActionRead])
 def get_platform_actions(
     platform_id: int,
+    response: Response,
     active_only: bool = True,
-    session: Session = Depends(get_session)
+    page: PageParams = Depends(),
+    session: Session = Depends(get_read_session)
 ):
-    """Get all actions for a specific platform"""
+    """Get actions for a specific platform, one page at a time ordered by ID"""
     # Verify platform exists
-    platform = session.exec(select(Platform).where(Platform.id == platform_id)).first()
-    if not platform:
+    platform = session.exec(statements.PLATFORM_EXISTS, params={"platform_id": platform_id}).first()
+    if platform is None:
         raise HTTPException(status_code=404, detail="Platform not found")
     
     # Get actions
-    statement = select(Action).where(Action.platform_id == platform_id)
+    criteria = [Action.platform_id == platform_id]
     if active_only:
-        statement = statement.where(Action.is_active == True)
+        criteria.append(Action.is_active == True)
     
-    actions = session.exec(statement).all()
-    return actions
+    return paginate(session, Action, ActionRead, criteria, [Action.id], page, response)
@@ -0,0 +1,18 @@
+from fastapi import APIRouter, Depends, Query
+from sqlmodel import Session
+from typing import List
+from app.api.deps import get_read_session
+from app.core.search import search_catalog
+from app.schemas.search import SearchResult
+
+router = APIRouter()
+
+
+@router.get("/", response_model=List[SearchResult])
+def search(
+    q: str = Query(min_length=1, description="Search terms; all terms must match"),
+    limit: int = Query(default=20, ge=1, le=100, description="Maximum number of results"),
+    session: Session = Depends(get_read_session)
+):
+    """Search platforms and actions by name, description and template content"""
+    return search_catalog(session, q, limit)
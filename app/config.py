@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Literal, Optional
 
 
 class Settings(BaseSettings):
@@ -15,6 +15,12 @@ class Settings(BaseSettings):
         """Construct database URL from components"""
         return f"postgresql://{self.db_username}:{self.db_password}@{self.db_host}:{self.db_port}/{self.db_name}"
 
+    # Read replicas (SQLAlchemy URLs). Replicas lagging more than replica_max_lag seconds, or
+    # failing the check every replica_health_check_interval seconds, are skipped for the primary
+    database_replica_urls: list[str] = []
+    replica_max_lag: float = 5.0
+    replica_health_check_interval: float = 5.0
+
     # API
     api_v1_str: str
     project_name: str
@@ -26,6 +32,87 @@ class Settings(BaseSettings):
     environment: str
     debug: bool
 
+    # Admin API: requests must send this value in X-Admin-Token; unset disables the admin API
+    admin_token: Optional[str] = None
+
+    # Catalog listing pagination
+    page_size_default: int = 100
+    page_size_max: int = 500
+
+    # Search: "auto" uses Postgres full-text search when available, else "memory"
+    search_backend: str = "auto"
+
+    # Share one computation between concurrent identical /convert requests
+    convert_singleflight_enabled: bool = True
+
+    # /convert/expand: the most combinations of select options one request may render
+    convert_expand_max_combinations: int = 1000
+
+    # Cross-process cache invalidation via Postgres LISTEN/NOTIFY
+    catalog_listener_enabled: bool = True
+    catalog_version_check_interval: float = 30.0
+
+    # Request profiling: sample this fraction of requests, or send X-Profile: <admin token>.
+    # The latest profiling_max_profiles profiles are kept in profiling_dir, shared by all workers
+    profiling_sample_rate: float = 0.0
+    profiling_interval: float = 0.005
+    profiling_max_profiles: int = 50
+    profiling_dir: str = "profiles"
+
+    # Caching: L1 is per process; CACHE_REDIS_URL adds a shared L2 ("memory://" for an in-process fake)
+    cache_l1_max_entries: int = 10000
+    cache_ttl_seconds: float = 300.0
+    cache_redis_url: Optional[str] = None
+    render_cache_enabled: bool = True
+
+    # Client-side validation schemas: max-age clients may reuse a schema before revalidating
+    schema_cache_max_age: int = 300
+
+    # Startup: "development" creates missing tables on boot; "production" skips DDL and only
+    # checks that the database is at the Alembic head revision
+    startup_mode: Literal["development", "production"] = "development"
+
+    # Admission control: concurrent requests per route class; more wait in a bounded queue
+    # for up to admission_queue_timeout seconds before being shed with a 503
+    admission_control_enabled: bool = True
+    admission_convert_concurrency: int = 20
+    admission_validate_concurrency: int = 8
+    admission_catalog_concurrency: int = 12
+    admission_queue_size: int = 50
+    admission_queue_timeout: float = 1.0
+    admission_retry_after: int = 1
+
+    # Background conversion jobs: uploads and results are stored in jobs_dir and queued in
+    # jobs_queue_url (default: a SQLite file in jobs_dir). Each API process runs jobs_workers
+    # threads; set 0 and run `python worker.py` to convert in separate processes instead
+    jobs_dir: str = "jobs"
+    jobs_queue_url: Optional[str] = None
+    jobs_workers: int = 2
+    jobs_chunk_size: int = 1000
+    jobs_stale_after: float = 300.0
+
+    # Conversion log: generated prompts are buffered and written in batches of up to
+    # conversion_log_batch_size rows, at least every conversion_log_flush_interval seconds.
+    # When conversion_log_max_buffer rows are waiting, "drop" discards new rows and "block"
+    # briefly holds the request for the writer to catch up
+    conversion_log_enabled: bool = True
+    conversion_log_batch_size: int = 500
+    conversion_log_flush_interval: float = 1.0
+    conversion_log_max_buffer: int = 10000
+    conversion_log_overflow: Literal["drop", "block"] = "drop"
+
+    # Hot set: per-action conversion counts that halve every hotset_half_life seconds, saved to
+    # hotset_path every hotset_persist_interval seconds. On startup the hotset_prewarm_top hottest
+    # actions are loaded into the caches before /health reports healthy (0 disables prewarming)
+    hotset_path: str = "hotset.json"
+    hotset_half_life: float = 3600.0
+    hotset_persist_interval: float = 60.0
+    hotset_prewarm_top: int = 50
+
+    # Response compression
+    gzip_minimum_size: int = 1000
+    gzip_compress_level: int = 6
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
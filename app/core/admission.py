@@ -0,0 +1,162 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from starlette.responses import JSONResponse
+from app.config import settings
+
+
+class AdmissionLimiter:
+    """
+    Caps concurrent requests of one route class
+
+    Requests over the limit wait in a bounded FIFO queue for up to
+    `queue_timeout` seconds; when the queue is full or the wait runs out the
+    request is rejected instead of piling up in the threadpool and the
+    connection pool. Runs on the event loop, so it needs no locks.
+    """
+
+    def __init__(self, name: str, max_concurrent: int, max_queue: int, queue_timeout: float):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self.admitted = 0
+        self.queued = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.peak_queue_depth = 0
+        self.queue_wait_total = 0.0
+
+    async def acquire(self) -> bool:
+        """Take a slot, waiting in the queue if needed; False means the request should be shed"""
+        if self.active < self.max_concurrent and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return True
+
+        if len(self._waiters) >= self.max_queue:
+            self.rejected_queue_full += 1
+            return False
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.queued += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, len(self._waiters))
+        started = time.perf_counter()
+        try:
+            await asyncio.wait({waiter}, timeout=self.queue_timeout)
+        except BaseException:
+            # Cancelled while queued, e.g. the client went away; hand back a slot passed to us
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            else:
+                self._discard(waiter)
+            raise
+        finally:
+            self.queue_wait_total += time.perf_counter() - started
+
+        if waiter.done():
+            # release() passed its slot straight to this waiter
+            self.admitted += 1
+            return True
+
+        self._discard(waiter)
+        self.rejected_timeout += 1
+        return False
+
+    def release(self) -> None:
+        """Give the slot to the oldest waiter, or free it"""
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        waiter.cancel()
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "max_concurrent": self.max_concurrent,
+            "max_queue": self.max_queue,
+            "queue_timeout": self.queue_timeout,
+            "active": self.active,
+            "queue_depth": len(self._waiters),
+            "peak_queue_depth": self.peak_queue_depth,
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_queue_wait": self.queue_wait_total / self.queued if self.queued else 0.0,
+        }
+
+
+class AdmissionControlMiddleware:
+    """
+    Applies a limiter per route class, matched by path prefix in order
+
+    Shed requests get an immediate 503 with Retry-After. Paths that match no
+    prefix (health checks, docs, admin) are never limited.
+    """
+
+    def __init__(self, app, routes: List[Tuple[str, Optional[AdmissionLimiter]]], retry_after: int):
+        self.app = app
+        self.routes = routes
+        self.retry_after = retry_after
+
+    async def __call__(self, scope, receive, send):
+        limiter = self._limiter_for(scope) if scope["type"] == "http" else None
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        if not await limiter.acquire():
+            response = JSONResponse(
+                {"detail": "Server is busy, retry later"},
+                status_code=503,
+                headers={"Retry-After": str(self.retry_after)}
+            )
+            await response(scope, receive, send)
+            return
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            limiter.release()
+
+    def _limiter_for(self, scope) -> Optional[AdmissionLimiter]:
+        path = scope["path"]
+        for prefix, limiter in self.routes:
+            if path.startswith(prefix):
+                return limiter
+        return None
+
+
+def _limiter(name: str, max_concurrent: int) -> AdmissionLimiter:
+    return AdmissionLimiter(name, max_concurrent, settings.admission_queue_size, settings.admission_queue_timeout)
+
+
+admission_limiters = {
+    "convert": _limiter("convert", settings.admission_convert_concurrency),
+    "validate": _limiter("validate", settings.admission_validate_concurrency),
+    "catalog": _limiter("catalog", settings.admission_catalog_concurrency),
+}
+
+# Most specific prefix first; a None limiter exempts the prefix
+admission_routes = [
+    # Job uploads and status polls are cheap; the work runs in job workers
+    (f"{settings.api_v1_str}/convert/jobs", None),
+    (f"{settings.api_v1_str}/convert/validate", admission_limiters["validate"]),
+    (f"{settings.api_v1_str}/convert", admission_limiters["convert"]),
+    (f"{settings.api_v1_str}/platforms", admission_limiters["catalog"]),
+    (f"{settings.api_v1_str}/actions", admission_limiters["catalog"]),
+    (f"{settings.api_v1_str}/search", admission_limiters["catalog"]),
+]
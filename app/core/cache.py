@@ -0,0 +1,251 @@
+import dataclasses
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Protocol, Tuple
+
+# Returned by get() when a key is absent; None is a cacheable value
+MISSING = object()
+
+# Dataclasses and enums that may be stored in L2, by name
+_CACHE_TYPES: Dict[str, type] = {}
+
+
+def register_cache_types(*types: type) -> None:
+    """Allow instances of these dataclasses and enums to be stored in the shared L2 cache"""
+    for cls in types:
+        _CACHE_TYPES[cls.__name__] = cls
+
+
+def _encode(value: Any) -> Any:
+    """Turn a cached value into JSON data, tagging the types JSON can't represent"""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, Enum):
+        return {"__type__": type(value).__name__, "value": value.value}
+    if isinstance(value, str):
+        return value
+    if isinstance(value, datetime):
+        return {"__type__": "datetime", "value": value.isoformat()}
+    if isinstance(value, tuple):
+        return {"__type__": "tuple", "items": [_encode(item) for item in value]}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if dataclasses.is_dataclass(value) and _CACHE_TYPES.get(type(value).__name__) is type(value):
+        return {
+            "__type__": type(value).__name__,
+            "fields": [_encode(getattr(value, field.name)) for field in dataclasses.fields(value)],
+        }
+    raise TypeError(f"{type(value).__name__} values can't be stored in the shared cache")
+
+
+def _decode_object(data: Dict[str, Any]) -> Any:
+    tag = data.get("__type__")
+    if tag is None:
+        return data
+    if tag == "tuple":
+        return tuple(data["items"])
+    if tag == "datetime":
+        return datetime.fromisoformat(data["value"])
+    cls = _CACHE_TYPES[tag]
+    return cls(data["value"]) if issubclass(cls, Enum) else cls(*data["fields"])
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a value for L2; JSON rather than pickle, so the cache server can't inject code"""
+    return json.dumps(_encode(value), separators=(",", ":")).encode()
+
+
+def loads(data: bytes) -> Any:
+    return json.loads(data, object_hook=_decode_object)
+
+
+class CacheBackend(Protocol):
+    """Shared out-of-process (L2) cache storing bytes"""
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+    def incr(self, key: str) -> int: ...
+
+
+class InMemoryBackend:
+    """Process-local CacheBackend, standing in for a shared backend in tests and local runs"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, Tuple[bytes, Optional[float]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            value, expires = item
+            if expires is not None and expires < time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ttl if ttl else None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = int(self._data.get(key, (b"0", None))[0]) + 1
+            self._data[key] = (str(value).encode(), None)
+            return value
+
+
+class RedisBackend:
+    """CacheBackend for any Redis-protocol server; requires the optional `redis` package"""
+
+    def __init__(self, url: str):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError("CACHE_REDIS_URL is set but the 'redis' package is not installed")
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(key, value, px=int(ttl * 1000) if ttl else None)
+
+    def incr(self, key: str) -> int:
+        return int(self._client.incr(key))
+
+
+class LRUCache:
+    """Thread-safe in-process LRU with a per-entry TTL"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._data: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+
+    def get(self, key: Any) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return MISSING
+            value, expires = item
+            if self.ttl and expires < time.monotonic():
+                del self._data[key]
+                return MISSING
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_entries:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """
+    L1 in-process LRU in front of an optional shared L2 backend
+
+    L2 keys embed a namespace generation shared by every process.
+    bump_generation() increments it, which orphans every shared entry at once
+    without scanning for keys; it must run once per change, in the process
+    that made it. Other processes only clear() their L1 and re-read the
+    generation, at the latest `generation_ttl` seconds later.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int,
+        ttl: float,
+        l2: Optional[CacheBackend] = None,
+        generation_ttl: float = 1.0
+    ):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.l1 = LRUCache(max_entries, ttl)
+        self.l2 = l2
+        self.generation_ttl = generation_ttl
+        self._generation: Optional[int] = None
+        self._generation_read_at = 0.0
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Any:
+        """Return the cached value or MISSING"""
+        value = self.l1.get(key)
+        if value is MISSING and self.l2 is not None:
+            data = self.l2.get(self._l2_key(key))
+            if data is not None:
+                value = loads(data)
+                self.l1.set(key, value)
+        if value is MISSING:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        self.l1.set(key, value)
+        if self.l2 is not None:
+            self.l2.set(self._l2_key(key), dumps(value), self.ttl)
+
+    def get_or_load(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Return the cached value, calling loader and caching its result on a miss"""
+        value = self.get(key)
+        if value is MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drop this process's entries and re-read the shared generation on next use"""
+        self.l1.clear()
+        self._generation = None
+
+    def bump_generation(self) -> None:
+        """Drop every entry in this namespace, locally and in the shared backend"""
+        self.l1.clear()
+        if self.l2 is not None:
+            self._generation = self.l2.incr(f"{self.namespace}:generation")
+            self._generation_read_at = time.monotonic()
+
+    def stats(self) -> Dict[str, Any]:
+        return {"entries": len(self.l1), "hits": self.hits, "misses": self.misses}
+
+    def _l2_key(self, key: str) -> str:
+        # Re-read periodically as well: a notification can arrive before the
+        # writing process has bumped the generation
+        now = time.monotonic()
+        if self._generation is None or now - self._generation_read_at >= self.generation_ttl:
+            data = self.l2.get(f"{self.namespace}:generation")
+            self._generation = int(data) if data is not None else 0
+            self._generation_read_at = now
+        return f"{self.namespace}:{self._generation}:{key}"
+
+
+def create_backend(redis_url: Optional[str]) -> Optional[CacheBackend]:
+    """Build the configured shared backend, or None for L1-only caching"""
+    if not redis_url:
+        return None
+    if redis_url == "memory://":
+        return InMemoryBackend()
+    return RedisBackend(redis_url)
@@ -0,0 +1,118 @@
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import Executable, Row
+from sqlmodel import Session
+from app.config import settings
+from app.database import read_router
+from app.core.cache import TieredCache, create_backend
+from app.core.catalog_events import on_catalog_change, on_catalog_commit
+from app.core import statements
+from app.core.records import PlatformRecord, ActionRecord, VariableRecord, TemplateRecord
+from app.models import ActionRead, ActionReadWithVariables, VariableRead
+
+_backend = create_backend(settings.cache_redis_url)
+
+# Platforms, actions and variable definitions
+catalog_cache = TieredCache("catalog", settings.cache_l1_max_entries, settings.cache_ttl_seconds, _backend)
+
+# Active template version (id + content) per action; compiled templates live in template_cache
+template_cache = TieredCache("templates", settings.cache_l1_max_entries, settings.cache_ttl_seconds, _backend)
+
+# Rendered prompts keyed by template version and variables
+render_cache = TieredCache("renders", settings.cache_l1_max_entries, settings.cache_ttl_seconds, _backend)
+
+
+def _fetch_all(statement: Executable, params: Dict[str, Any]) -> List[Row[Any]]:
+    """Run a registered column select on a pooled connection, without an ORM session"""
+    with read_router.read_engine().connect() as connection:
+        return connection.execute(statement, params).all()
+
+
+def _fetch_one(statement: Executable, params: Dict[str, Any]) -> Optional[Sequence[Any]]:
+    """Run a registered column select and return its first row, if any"""
+    with read_router.read_engine().connect() as connection:
+        return connection.execute(statement, params).first()
+
+
+def get_platform(platform_id: Optional[int]) -> Optional[PlatformRecord]:
+    """Get a platform by ID through the catalog cache"""
+    if platform_id is None:
+        return None
+
+    def load():
+        row = _fetch_one(statements.PLATFORM_BY_ID, {"platform_id": platform_id})
+        return PlatformRecord.from_row(row) if row else None
+    return catalog_cache.get_or_load(f"platform:{platform_id}", load)
+
+
+def get_action(action_id: Optional[int]) -> Optional[ActionRecord]:
+    """Get an action by ID through the catalog cache"""
+    if action_id is None:
+        return None
+
+    def load():
+        row = _fetch_one(statements.ACTION_BY_ID, {"action_id": action_id})
+        return ActionRecord.from_row(row) if row else None
+    return catalog_cache.get_or_load(f"action:{action_id}", load)
+
+
+def get_variables(action_id: int) -> Tuple[VariableRecord, ...]:
+    """Get an action's variable definitions in display order through the catalog cache"""
+
+    def load():
+        rows = _fetch_all(statements.VARIABLES_BY_ACTION, {"action_id": action_id})
+        return tuple(VariableRecord.from_row(row) for row in rows)
+    return catalog_cache.get_or_load(f"variables:{action_id}", load)
+
+
+def get_active_template(action_id: int) -> Optional[TemplateRecord]:
+    """Get the action's active template version through the template cache"""
+
+    def load():
+        row = _fetch_one(statements.ACTIVE_TEMPLATE_BY_ACTION, {"action_id": action_id})
+        return TemplateRecord.from_row(row) if row else None
+    return template_cache.get_or_load(f"active:{action_id}", load)
+
+
+def get_action_detail(action_id: int) -> Optional[Dict[str, Any]]:
+    """
+    Get an action with its variables, serialized as ActionReadWithVariables, through the catalog cache
+
+    Only this detail view needs timestamps, so it reads full rows and caches
+    the response instead of widening the records used on the convert path.
+    """
+
+    def load():
+        with Session(read_router.read_engine()) as session:
+            action = session.exec(statements.ACTION_ENTITY_BY_ID, params={"action_id": action_id}).first()
+            if action is None:
+                return None
+            variables = session.exec(statements.VARIABLE_ENTITIES_BY_ACTION, params={"action_id": action_id}).all()
+            return ActionReadWithVariables(
+                **ActionRead.model_validate(action).model_dump(),
+                variables=[VariableRead.model_validate(var) for var in variables]
+            ).model_dump(mode="json")
+    return catalog_cache.get_or_load(f"action_detail:{action_id}", load)
+
+
+def _affected_caches(tables: Set[str]) -> List[TieredCache]:
+    caches = []
+    if tables & {"platforms", "actions", "variables"}:
+        caches.append(catalog_cache)
+    if tables & {"actions", "templates"}:
+        caches.append(template_cache)
+    # Rendering depends on validation rules and template content alike
+    caches.append(render_cache)
+    return caches
+
+
+@on_catalog_commit
+def _orphan_shared_entries(tables: Set[str]) -> None:
+    """Only the writing process bumps the shared generations, so workers keep agreeing on them"""
+    for cache in _affected_caches(tables):
+        cache.bump_generation()
+
+
+@on_catalog_change
+def _invalidate_catalog_caches(tables: Set[str]) -> None:
+    for cache in _affected_caches(tables):
+        cache.clear()
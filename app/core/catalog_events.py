@@ -0,0 +1,59 @@
+import itertools
+from typing import Callable, Iterable, List, Set
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+# Tables whose contents make up the platform/action catalog
+CATALOG_TABLES = {"platforms", "actions", "variables", "templates"}
+
+CatalogListener = Callable[[Set[str]], None]
+
+_listeners: List[CatalogListener] = []
+_commit_listeners: List[CatalogListener] = []
+
+
+def on_catalog_change(listener: CatalogListener) -> CatalogListener:
+    """Register a callback invoked with the set of changed catalog tables"""
+    _listeners.append(listener)
+    return listener
+
+
+def on_catalog_commit(listener: CatalogListener) -> CatalogListener:
+    """Register a callback invoked only for catalog changes committed by this process, before on_catalog_change"""
+    _commit_listeners.append(listener)
+    return listener
+
+
+def notify_catalog_change(tables: Iterable[str]) -> None:
+    """Tell every registered listener that the given tables changed"""
+    changed = set(tables) & CATALOG_TABLES
+    if not changed:
+        return
+    for listener in list(_listeners):
+        listener(changed)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_catalog_changes(session: Session, flush_context) -> None:
+    """Remember which catalog tables were written in this transaction"""
+    changed = session.info.setdefault("catalog_changes", set())
+    for obj in itertools.chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table in CATALOG_TABLES:
+            changed.add(table)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_catalog_changes(session: Session) -> None:
+    """Notify listeners once the writes are committed and visible"""
+    changed = session.info.pop("catalog_changes", None)
+    if changed:
+        for listener in list(_commit_listeners):
+            listener(changed)
+        notify_catalog_change(changed)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_catalog_changes(session: Session) -> None:
+    """Rolled back writes never became visible, so nothing to announce"""
+    session.info.pop("catalog_changes", None)
@@ -1,37 +1,181 @@
-from typing import Dict, Any, List
-from jinja2 import Template as Jinja2Template, TemplateError
-from app.models import Template, Variable, Action, Platform
+import itertools
+import math
+from typing import AsyncIterator, Dict, Any, Iterator, List, Sequence, Tuple
+from app.config import settings
+from app.core import catalog
+from app.core.cache import MISSING
+from app.core.singleflight import request_key
+from app.core.records import ActionRecord, TemplateRecord, VariableRecord
 from app.schemas.convert import ValidationError
-from sqlmodel import Session, select
+from app.core.template_cache import async_compiled_templates, compiled_templates
+
+BROWSER_USE_MARKER = "You are a web automation agent"
+
+# Browser Use context wrapper for legacy templates
+BROWSER_USE_PREFIX = """You are a web automation agent. Your task is to execute the following action using browser automation:
+
+"""
+
+BROWSER_USE_SUFFIX = """
+
+Instructions for execution:
+1. Take your time to understand the current page state
+2. Look for the most reliable selectors (prefer IDs, then classes, then text content)
+3. Handle dynamic content and loading states appropriately  
+4. Provide clear feedback on what you're doing at each step
+5. If elements are not immediately visible, try scrolling or waiting briefly
+6. Report any errors encountered with specific details
+
+Success criteria: Complete the requested action accurately and confirm the result."""
 
 
 class PromptConverter:
     """Core prompt conversion logic"""
     
-    def __init__(self, session: Session):
-        self.session = session
-    
     def convert_to_prompt(
         self, 
         platform_id: int, 
         action_id: int, 
-        variables: Dict[str, Any]
+        variables: Dict[str, Any],
+        cache: bool = True
     ) -> tuple[str, List[ValidationError]]:
         """
         Convert platform + action + variables to final prompt
         
+        Pass `cache=False` for one-off bulk work so it doesn't evict the
+        render cache's hot entries.
+        
         Returns:
             tuple: (generated_prompt, validation_errors)
         """
+        template, validation_errors = self._prepare(platform_id, action_id, variables)
+        if validation_errors:
+            return "", validation_errors
+        
+        # Serve a previously rendered prompt for the same template version and variables
+        use_cache = cache and settings.render_cache_enabled
+        cache_key = f"{template.id}:{request_key(variables)}" if use_cache else None
+        if use_cache:
+            prompt = catalog.render_cache.get(cache_key)
+            if prompt is not MISSING:
+                return prompt, []
+        
+        # Generate prompt
+        try:
+            prompt = self._generate_prompt(template, variables)
+            if use_cache:
+                catalog.render_cache.set(cache_key, prompt)
+            return prompt, []
+        except Exception as e:
+            return "", [ValidationError(field="template", message=f"Template error: {str(e)}")]
+    
+    def stream_prompt(
+        self,
+        platform_id: int,
+        action_id: int,
+        variables: Dict[str, Any]
+    ) -> tuple[AsyncIterator[str] | None, List[ValidationError]]:
+        """
+        Validate synchronously, then return an async iterator over prompt chunks
+        
+        The prompt is rendered with Jinja's async mode as it is consumed, so the
+        first chunk is available before the whole prompt has been rendered.
+        
+        Returns:
+            tuple: (chunk_iterator, validation_errors)
+        """
+        from jinja2 import TemplateError
+
+        template, validation_errors = self._prepare(platform_id, action_id, variables)
+        if validation_errors:
+            return None, validation_errors
+        
+        try:
+            compiled = async_compiled_templates.get(template.id, template.content)
+        except TemplateError as e:
+            return None, [ValidationError(field="template", message=f"Template error: Template rendering error: {str(e)}")]
+        
+        return self._stream_prompt(template, compiled, variables), []
+    
+    def expand_prompts(
+        self,
+        platform_id: int,
+        action_id: int,
+        variables: Dict[str, Any],
+        expand: Sequence[str],
+        max_combinations: int
+    ) -> tuple[Iterator[Tuple[Dict[str, str], str, List[ValidationError]]] | None, int, List[ValidationError]]:
+        """
+        Validate once, then lazily render every combination of the options of the `expand` variables
+        
+        Each expanded variable must be a select variable; its options replace
+        any fixed value. The template is compiled once and each combination is
+        only rendered when the iterator reaches it.
+        
+        Returns:
+            tuple: (iterator of (combination, prompt, errors), combination_count, validation_errors)
+        """
+        from jinja2 import TemplateError
+
+        axes, axis_errors = self._expansion_axes(action_id, expand)
+        
+        # Expanded values are valid options by construction, so checking the
+        # request with the first combination covers all of them
+        first = {name: options[0] for name, options in axes}
+        template, validation_errors = self._prepare(platform_id, action_id, {**variables, **first})
+        if any(error.field in ("action", "template") for error in validation_errors):
+            # Without the action's variables the expansion can't be checked either
+            return None, 0, validation_errors
+        if validation_errors or axis_errors:
+            return None, 0, axis_errors + validation_errors
+        
+        count = math.prod(len(options) for _, options in axes)
+        if count > max_combinations:
+            return None, count, [ValidationError(
+                field="expand",
+                message=f"Expansion has {count} combinations, more than the limit of {max_combinations}"
+            )]
+        
+        try:
+            compiled = compiled_templates.get(template.id, template.content)
+        except TemplateError as e:
+            return None, count, [ValidationError(field="template", message=f"Template error: Template rendering error: {str(e)}")]
+        
+        return self._expand(compiled, variables, axes), count, []
+    
+    def _expansion_axes(
+        self,
+        action_id: int,
+        expand: Sequence[str]
+    ) -> tuple[List[Tuple[str, Sequence[str]]], List[ValidationError]]:
+        """Pair each variable to expand with its options; only select variables with options qualify"""
+        defs_by_name = {var_def.name: var_def for var_def in self._get_variables(action_id)}
+        axes = []
+        errors = []
+        for name in dict.fromkeys(expand):
+            var_def = defs_by_name.get(name)
+            if not var_def or var_def.type != "select" or not var_def.options:
+                errors.append(ValidationError(field=name, message="Only select variables with options can be expanded"))
+            else:
+                axes.append((name, var_def.options))
+        return axes, errors
+    
+    def _prepare(
+        self,
+        platform_id: int,
+        action_id: int,
+        variables: Dict[str, Any]
+    ) -> tuple[TemplateRecord | None, List[ValidationError]]:
+        """Check the platform/action combination and validate variables"""
         # Validate the combination exists
         action = self._get_action(platform_id, action_id)
         if not action:
-            return "", [ValidationError(field="action", message="Invalid platform/action combination")]
+            return None, [ValidationError(field="action", message="Invalid platform/action combination")]
         
-        # Get template
+        # Get the active template version
         template = self._get_template(action_id)
         if not template:
-            return "", [ValidationError(field="template", message="No template found for this action")]
+            return None, [ValidationError(field="template", message="No template found for this action")]
         
         # Get variables definition
         variable_defs = self._get_variables(action_id)
@@ -39,40 +183,28 @@ class PromptConverter:
         # Validate variables
         validation_errors = self._validate_variables(variable_defs, variables)
         if validation_errors:
-            return "", validation_errors
+            return None, validation_errors
         
-        # Generate prompt
-        try:
-            prompt = self._generate_prompt(template.content, variables)
-            return prompt, []
-        except Exception as e:
-            return "", [ValidationError(field="template", message=f"Template error: {str(e)}")]
+        return template, []
     
-    def _get_action(self, platform_id: int, action_id: int) -> Action | None:
+    def _get_action(self, platform_id: int, action_id: int) -> ActionRecord | None:
         """Get action and verify it belongs to the platform"""
-        statement = select(Action).where(
-            Action.id == action_id,
-            Action.platform_id == platform_id,
-            Action.is_active == True
-        )
-        return self.session.exec(statement).first()
+        action = catalog.get_action(action_id)
+        if not action or action.platform_id != platform_id or not action.is_active:
+            return None
+        return action
     
-    def _get_template(self, action_id: int) -> Template | None:
-        """Get template for action"""
-        statement = select(Template).where(
-            Template.action_id == action_id,
-            Template.is_active == True
-        )
-        return self.session.exec(statement).first()
+    def _get_template(self, action_id: int) -> TemplateRecord | None:
+        """Get the active template version for action"""
+        return catalog.get_active_template(action_id)
     
-    def _get_variables(self, action_id: int) -> List[Variable]:
+    def _get_variables(self, action_id: int) -> Sequence[VariableRecord]:
         """Get variable definitions for action"""
-        statement = select(Variable).where(Variable.action_id == action_id)
-        return list(self.session.exec(statement).all())
+        return catalog.get_variables(action_id)
     
     def _validate_variables(
         self, 
-        variable_defs: List[Variable], 
+        variable_defs: Sequence[VariableRecord], 
         user_variables: Dict[str, Any]
     ) -> List[ValidationError]:
         """Validate user variables against definitions"""
@@ -117,20 +249,16 @@ class PromptConverter:
         
         return errors
     
-    def _generate_prompt(self, template_content: str, variables: Dict[str, Any]) -> str:
+    def _generate_prompt(self, template_version: TemplateRecord, variables: Dict[str, Any]) -> str:
         """Generate prompt from template and variables with Browser Use optimizations"""
+        from jinja2 import TemplateError
+
         try:
-            # Use Jinja2 for advanced template processing
-            template = Jinja2Template(template_content)
-            
-            # Filter out None values and convert to strings
-            clean_variables = {
-                k: str(v) if v is not None else ""
-                for k, v in variables.items()
-            }
+            # Use Jinja2 for advanced template processing, compiled once per version
+            template = compiled_templates.get(template_version.id, template_version.content)
             
             # Add Browser Use specific context if not already present
-            rendered_prompt = template.render(**clean_variables)
+            rendered_prompt = template.render(**self._clean_variables(variables))
             
             # Enhance prompt with Browser Use best practices
             enhanced_prompt = self._enhance_for_browser_use(rendered_prompt)
@@ -142,26 +270,72 @@ class PromptConverter:
         except Exception as e:
             raise Exception(f"Prompt generation error: {str(e)}")
     
+    async def _stream_prompt(
+        self,
+        template_version: TemplateRecord,
+        template,
+        variables: Dict[str, Any]
+    ) -> AsyncIterator[str]:
+        """Render chunks, applying the same wrapping and stripping as _generate_prompt"""
+        # The wrapper decision has to be made before rendering, so it is taken
+        # from the template source rather than the rendered output
+        wrap = BROWSER_USE_MARKER not in template_version.content
+        if wrap:
+            yield BROWSER_USE_PREFIX
+        
+        started = wrap
+        pending = ""
+        async for chunk in template.generate_async(**self._clean_variables(variables)):
+            if not started:
+                chunk = chunk.lstrip()
+                if not chunk:
+                    continue
+                started = True
+            if wrap:
+                yield chunk
+                continue
+            # Hold back trailing whitespace until more content follows it
+            body = chunk.rstrip()
+            if body:
+                yield pending + body
+                pending = chunk[len(body):]
+            else:
+                pending += chunk
+        
+        if wrap:
+            yield BROWSER_USE_SUFFIX
+    
+    def _expand(
+        self,
+        template,
+        variables: Dict[str, Any],
+        axes: List[Tuple[str, Sequence[str]]]
+    ) -> Iterator[Tuple[Dict[str, str], str, List[ValidationError]]]:
+        """Render the combinations of `axes` one at a time, in option order"""
+        names = [name for name, _ in axes]
+        fixed = self._clean_variables(variables)
+        for values in itertools.product(*(options for _, options in axes)):
+            combination = dict(zip(names, values))
+            try:
+                rendered = template.render(**{**fixed, **combination})
+            except Exception as e:
+                yield combination, "", [ValidationError(field="template", message=f"Template error: Template rendering error: {str(e)}")]
+                continue
+            yield combination, self._enhance_for_browser_use(rendered).strip(), []
+    
+    def _clean_variables(self, variables: Dict[str, Any]) -> Dict[str, str]:
+        """Filter out None values and convert to strings"""
+        return {
+            k: str(v) if v is not None else ""
+            for k, v in variables.items()
+        }
+    
     def _enhance_for_browser_use(self, prompt: str) -> str:
         """Enhance prompt with Browser Use specific patterns"""
         # Check if prompt already follows Browser Use patterns
-        if "You are a web automation agent" in prompt:
+        if BROWSER_USE_MARKER in prompt:
             # Already enhanced, return as-is
             return prompt
         
         # Add Browser Use context wrapper for legacy templates
-        enhanced = f"""You are a web automation agent. Your task is to execute the following action using browser automation:
-
-{prompt}
-
-Instructions for execution:
-1. Take your time to understand the current page state
-2. Look for the most reliable selectors (prefer IDs, then classes, then text content)
-3. Handle dynamic content and loading states appropriately  
-4. Provide clear feedback on what you're doing at each step
-5. If elements are not immediately visible, try scrolling or waiting briefly
-6. Report any errors encountered with specific details
-
-Success criteria: Complete the requested action accurately and confirm the result."""
-        
-        return enhanced
+        return f"{BROWSER_USE_PREFIX}{prompt}{BROWSER_USE_SUFFIX}"
@@ -0,0 +1,91 @@
+import heapq
+import json
+import logging
+import os
+import threading
+import time
+from operator import itemgetter
+from typing import Dict, List, Tuple
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HotSet:
+    """
+    Per-action conversion counts that decay by half every `half_life` seconds
+
+    Rather than decaying every counter on each tick, new hits are weighted by
+    2^(t / half_life) relative to a moving epoch, and scores are divided by
+    the current weight when read. A hit costs one dict update.
+    """
+
+    # Rebase well before the weights (2^exponent) lose float precision or overflow
+    _MAX_EXPONENT = 40.0
+
+    def __init__(self, half_life: float, max_tracked: int = 10000):
+        self.half_life = half_life
+        self.max_tracked = max_tracked
+        self._lock = threading.Lock()
+        self._epoch = time.time()
+        self._scores: Dict[int, float] = {}
+
+    def record(self, action_id: int) -> None:
+        """Count one conversion of an action"""
+        with self._lock:
+            weight = self._weight(time.time())
+            self._scores[action_id] = self._scores.get(action_id, 0.0) + weight
+            if len(self._scores) > self.max_tracked:
+                # Forget the coldest half rather than growing without bound
+                self._scores = dict(heapq.nlargest(self.max_tracked // 2, self._scores.items(), key=itemgetter(1)))
+
+    def top(self, n: int) -> List[Tuple[int, float]]:
+        """The `n` hottest actions with their current decayed scores, hottest first"""
+        with self._lock:
+            weight = self._weight(time.time())
+            hottest = heapq.nlargest(n, self._scores.items(), key=itemgetter(1))
+        return [(action_id, score / weight) for action_id, score in hottest]
+
+    def save(self, path: str) -> None:
+        """Write the current scores to `path`, replacing it atomically"""
+        scores = self.top(self.max_tracked)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"saved_at": time.time(), "scores": {str(action_id): score for action_id, score in scores}}, f)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        """
+        Add scores saved by a previous run, decayed by the time since they were saved
+
+        A missing or unreadable file only means starting with a cold cache.
+        """
+        try:
+            with open(path) as f:
+                saved = json.load(f)
+            now = time.time()
+            decay = 2.0 ** (-max(now - float(saved["saved_at"]), 0) / self.half_life)
+            scores = {int(action_id): float(score) * decay for action_id, score in saved["scores"].items()}
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            logger.exception("Ignoring unreadable hot set file %s", path)
+            return
+        with self._lock:
+            weight = self._weight(now)
+            for action_id, score in scores.items():
+                self._scores[action_id] = self._scores.get(action_id, 0.0) + score * weight
+
+    def _weight(self, now: float) -> float:
+        """Weight of a hit at `now`, moving the epoch to `now` first if it has grown too large; needs the lock"""
+        exponent = (now - self._epoch) / self.half_life
+        if exponent > self._MAX_EXPONENT:
+            # 2^-exponent underflows to 0 rather than overflowing, however long since the last rebase
+            decay = 2.0 ** -exponent
+            self._scores = {action_id: score * decay for action_id, score in self._scores.items()}
+            self._epoch = now
+            return 1.0
+        return 2.0 ** exponent
+
+
+hot_set = HotSet(settings.hotset_half_life)
@@ -0,0 +1,101 @@
+import hashlib
+import json
+import math
+from typing import Any, Dict, List, Sequence, Tuple
+from app.core.records import ActionRecord, VariableRecord
+from app.models import VariableType
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+# Characters str.strip() removes, spelled out because regex \s differs between dialects
+_WHITESPACE = "".join(f"\\u{code:04x}" for code in range(0x10000) if chr(code).isspace())
+
+# Strings accepted by float(), which is how the converter checks number variables
+_DIGITS = r"[0-9](_?[0-9])*"
+NUMBER_PATTERN = (
+    rf"^[{_WHITESPACE}]*[+-]?("
+    rf"({_DIGITS}(\.({_DIGITS})?)?|\.{_DIGITS})([eE][+-]?{_DIGITS})?"
+    r"|[Ii][Nn][Ff]([Ii][Nn][Ii][Tt][Yy])?|[Nn][Aa][Nn]"
+    rf")[{_WHITESPACE}]*$"
+)
+
+# A string with something other than whitespace, i.e. str(value).strip() != ""
+NOT_BLANK_PATTERN = f"[^{_WHITESPACE}]"
+
+# Falsy values: the converter only checks select options and emails of truthy values
+_FALSY = [0, False, [], {}]
+
+
+def _option_values(options: Sequence[str]) -> List[Any]:
+    """JSON values whose str() is one of the options"""
+    values: List[Any] = []
+    for option in options:
+        values.append(option)
+        if option == "True":
+            values.append(True)
+        for parse in (int, float):
+            try:
+                number = parse(option)
+            except ValueError:
+                continue
+            if str(number) == option and math.isfinite(number):
+                values.append(number)
+                break
+    return values
+
+
+def _variable_schema(var: VariableRecord) -> Dict[str, Any]:
+    """
+    Mirror PromptConverter._validate_variables for a single variable
+
+    The converter checks str(value) of any JSON value, so the schema accepts
+    the same non-string values it does. The remaining differences:
+    - numbers whose str() depends on how they were written, e.g. 1.0 for a
+      "1" option, follow JSON Schema's numeric equality
+    - non-empty arrays and objects are rejected for select and email
+      variables, where the converter would compare their Python repr
+    - number strings must use ASCII digits; float() also takes other scripts'
+    """
+    schema: Dict[str, Any] = {"title": var.label}
+    if var.placeholder:
+        schema["description"] = var.placeholder
+    if var.default_value is not None:
+        schema["default"] = var.default_value
+
+    if var.type == VariableType.NUMBER:
+        # float() takes numbers, booleans and numeric strings; "" is not a number even when optional
+        schema["type"] = ["number", "boolean", "string"] if var.required else ["number", "boolean", "string", "null"]
+        schema["pattern"] = NUMBER_PATTERN
+    elif var.type == VariableType.SELECT and var.options:
+        options = [option for option in var.options if option.strip()] if var.required else var.options
+        # Falsy values skip the options check; "" and null only pass when the variable is optional
+        schema["enum"] = _option_values(options) + _FALSY + ([] if var.required else ["", None])
+    elif var.type == VariableType.EMAIL:
+        email: Dict[str, Any] = {"type": "string", "pattern": "@"}
+        schema["anyOf"] = [email, {"enum": _FALSY + ([] if var.required else ["", None])}]
+    elif var.required:
+        # Any value counts, as long as it isn't null or a blank string
+        schema["not"] = {"type": "null"}
+        schema["pattern"] = NOT_BLANK_PATTERN
+
+    return schema
+
+
+def build_action_schema(action: ActionRecord, variables: Sequence[VariableRecord], schema_id: str) -> Tuple[Dict[str, Any], str]:
+    """
+    Build the JSON Schema for an action's variables object
+
+    Returns the schema and a strong ETag derived from its canonical JSON.
+    """
+    schema = {
+        "$schema": JSON_SCHEMA_DIALECT,
+        "$id": schema_id,
+        "title": action.name,
+        "type": "object",
+        "properties": {var.name: _variable_schema(var) for var in variables},
+        "required": [var.name for var in variables if var.required],
+        "additionalProperties": True,
+    }
+    canonical = json.dumps(schema, sort_keys=True, separators=(",", ":"))
+    etag = '"' + hashlib.sha256(canonical.encode()).hexdigest()[:32] + '"'
+    return schema, etag
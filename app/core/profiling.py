@@ -0,0 +1,238 @@
+import asyncio
+import json
+import logging
+import os
+import random
+import re
+import secrets
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Leaf frames of threads that are parked rather than doing work
+_IDLE_LEAVES = {
+    ("threading", "wait"),
+    ("selectors", "select"),
+    ("queue", "get"),
+    ("asyncio.base_events", "_run_once"),
+}
+
+
+def _frame_label(frame) -> str:
+    return f"{frame.f_globals.get('__name__', '?')}:{frame.f_code.co_name}"
+
+
+class StackSampler:
+    """
+    Periodically samples the Python stacks of all threads
+
+    Sync routes run in threadpool workers, so every busy thread is sampled
+    while the profiled request runs; concurrent requests can show up too.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.stacks: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        own = threading.get_ident()
+        names = {}
+        while True:
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident == own:
+                    continue
+                stack = []
+                leaf = (frame.f_globals.get("__name__"), frame.f_code.co_name)
+                if leaf in _IDLE_LEAVES:
+                    continue
+                while frame is not None:
+                    stack.append(_frame_label(frame))
+                    frame = frame.f_back
+                if ident not in names:
+                    names = {thread.ident: thread.name for thread in threading.enumerate()}
+                stack.append(names.get(ident, str(ident)))
+                self.stacks[";".join(reversed(stack))] += 1
+            if self._stop.wait(self.interval):
+                return
+
+
+class ProfileRecord:
+    """A captured request profile"""
+
+    def __init__(
+        self, id: str, method: str, path: str, stacks: Counter, samples: int, duration: float, status: Optional[int]
+    ):
+        self.id = id
+        self.method = method
+        self.path = path
+        self.status = status
+        self.samples = samples
+        self.duration_ms = round(duration * 1000, 2)
+        self.created_at = datetime.now(timezone.utc)
+        self.stacks = stacks
+
+    def summary(self) -> Dict:
+        return {
+            "id": self.id,
+            "method": self.method,
+            "path": self.path,
+            "status": self.status,
+            "duration_ms": self.duration_ms,
+            "samples": self.samples,
+            "created_at": self.created_at.isoformat(),
+        }
+
+    def collapsed(self) -> str:
+        """Render stacks in the collapsed format read by flamegraph.pl and speedscope"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+_PROFILE_ID = re.compile(r"^[0-9a-f]{32}$")
+
+
+class ProfileStore:
+    """
+    Keeps the most recent request profiles in a directory
+
+    Each profile is a `<id>.collapsed` stacks file plus a `<id>.json`
+    summary, written last, so every worker sharing the directory can list
+    and serve profiles captured by the others.
+    """
+
+    def __init__(self, directory: str, max_profiles: int):
+        self.directory = directory
+        self.max_profiles = max_profiles
+
+    def add(self, record: ProfileRecord) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        self._write(f"{record.id}.collapsed", record.collapsed())
+        self._write(f"{record.id}.json", json.dumps(record.summary()))
+        self._prune()
+
+    def list(self) -> List[Dict]:
+        """Profile summaries, newest first"""
+        summaries = []
+        for path in self._summary_paths():
+            try:
+                with open(path) as f:
+                    summaries.append(json.load(f))
+            except (OSError, ValueError):
+                # Pruned by another worker, or still being written
+                continue
+        return sorted(summaries, key=lambda summary: summary["created_at"], reverse=True)
+
+    def collapsed(self, profile_id: str) -> Optional[str]:
+        """The profile's collapsed stacks, or None when it doesn't exist"""
+        if not _PROFILE_ID.match(profile_id) or not os.path.exists(self._path(f"{profile_id}.json")):
+            return None
+        try:
+            with open(self._path(f"{profile_id}.collapsed")) as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _write(self, name: str, content: str) -> None:
+        tmp_path = self._path(f"{name}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, self._path(name))
+
+    def _summary_paths(self) -> List[str]:
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return []
+        return [self._path(name) for name in names if name.endswith(".json")]
+
+    def _prune(self) -> None:
+        """Delete the oldest profiles beyond max_profiles"""
+        paths = []
+        for path in self._summary_paths():
+            try:
+                paths.append((os.path.getmtime(path), path))
+            except OSError:
+                continue
+        paths.sort(reverse=True)
+        for _, path in paths[self.max_profiles:]:
+            for stale in (path, path[:-len(".json")] + ".collapsed"):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that send `X-Profile: <admin token>`, plus a random
+    `sample_rate` fraction of all requests
+
+    When neither applies, the only cost is a header lookup.
+    """
+
+    def __init__(self, app, store: ProfileStore, admin_token: Optional[str], sample_rate: float, interval: float):
+        self.app = app
+        self.store = store
+        self.admin_token = admin_token
+        self.sample_rate = sample_rate
+        self.interval = interval
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        status: List[int] = []
+
+        async def send_with_profile_id(message):
+            if message["type"] == "http.response.start":
+                status.append(message["status"])
+                message["headers"] = list(message.get("headers", [])) + [(b"x-profile-id", profile_id.encode())]
+            await send(message)
+
+        sampler = StackSampler(self.interval)
+        started = time.perf_counter()
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            sampler.stop()
+            record = ProfileRecord(
+                profile_id, scope["method"], scope["path"], sampler.stacks, sampler.samples,
+                time.perf_counter() - started, status[0] if status else None
+            )
+            try:
+                await asyncio.to_thread(self.store.add, record)
+            except OSError:
+                logger.exception("Could not save profile %s", profile_id)
+
+    def _should_profile(self, scope) -> bool:
+        if self.admin_token:
+            for name, value in scope["headers"]:
+                if name == b"x-profile":
+                    return secrets.compare_digest(value, self.admin_token.encode())
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+
+profile_store = ProfileStore(settings.profiling_dir, settings.profiling_max_profiles)
@@ -0,0 +1,92 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Tuple
+from app.core.cache import register_cache_types
+from app.models import Platform, Action, Variable, VariableType, TemplateVersion
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Share one copy of short, frequently repeated strings such as slugs and labels"""
+    return sys.intern(value) if value is not None else None
+
+
+@dataclass(frozen=True, slots=True)
+class PlatformRecord:
+    """Immutable in-memory snapshot of a platform"""
+    id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    is_active: bool
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "PlatformRecord":
+        id, name, slug, description, is_active = row
+        return cls(id, _intern(name), _intern(slug), description, is_active)
+
+
+@dataclass(frozen=True, slots=True)
+class ActionRecord:
+    """Immutable in-memory snapshot of an action"""
+    id: int
+    platform_id: int
+    name: str
+    slug: str
+    description: Optional[str]
+    is_active: bool
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "ActionRecord":
+        id, platform_id, name, slug, description, is_active = row
+        return cls(id, platform_id, _intern(name), _intern(slug), description, is_active)
+
+
+@dataclass(frozen=True, slots=True)
+class VariableRecord:
+    """Immutable in-memory snapshot of a variable definition"""
+    id: int
+    action_id: int
+    name: str
+    label: str
+    type: VariableType
+    required: bool
+    placeholder: Optional[str]
+    default_value: Optional[str]
+    options: Optional[Tuple[str, ...]]
+    order: int
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "VariableRecord":
+        id, action_id, name, label, type, required, placeholder, default_value, options, order = row
+        return cls(
+            id, action_id, _intern(name), _intern(label), VariableType(type), required,
+            _intern(placeholder), _intern(default_value),
+            tuple(_intern(option) for option in options) if options is not None else None,
+            order
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateRecord:
+    """Immutable in-memory snapshot of a template version"""
+    id: int
+    action_id: int
+    version: int
+    content: str
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> "TemplateRecord":
+        id, action_id, version, content = row
+        return cls(id, action_id, version, content)
+
+
+# Columns to select for each record, in from_row order
+PLATFORM_COLUMNS = (Platform.id, Platform.name, Platform.slug, Platform.description, Platform.is_active)
+ACTION_COLUMNS = (Action.id, Action.platform_id, Action.name, Action.slug, Action.description, Action.is_active)
+VARIABLE_COLUMNS = (
+    Variable.id, Variable.action_id, Variable.name, Variable.label, Variable.type, Variable.required,
+    Variable.placeholder, Variable.default_value, Variable.options, Variable.order
+)
+TEMPLATE_COLUMNS = (TemplateVersion.id, TemplateVersion.action_id, TemplateVersion.version, TemplateVersion.content)
+
+register_cache_types(PlatformRecord, ActionRecord, VariableRecord, TemplateRecord, VariableType)
@@ -0,0 +1,123 @@
+import itertools
+import logging
+import math
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+
+logger = logging.getLogger(__name__)
+
+# Seconds since the last replayed transaction, or 0 when a streaming replica
+# has replayed everything it received (an idle primary would otherwise look
+# lagged). A replica whose WAL receiver is not streaming has stopped hearing
+# from the primary, so it reports infinite lag however caught up it looks.
+_POSTGRES_LAG = text("""
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 'Infinity'::float8
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+class _Replica:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.healthy = False
+        self.lag: Optional[float] = None
+        self.error: Optional[str] = None
+
+
+class ReplicaRouter:
+    """
+    Picks the engine for read-only queries
+
+    Reads go round-robin to replicas that passed the last health check and
+    lag the primary by at most `max_lag` seconds. With no usable replica,
+    before start(), or while pinned after a catalog change, reads go to
+    the primary. Writes always use the primary engine directly.
+    """
+
+    def __init__(self, primary: Engine, replicas: List[Engine], max_lag: float, check_interval: float):
+        self.primary = primary
+        self.max_lag = max_lag
+        self.check_interval = check_interval
+        self._replicas = [_Replica(engine) for engine in replicas]
+        self._healthy: List[Engine] = []
+        self._counter = itertools.count()
+        self._pinned_until = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def read_engine(self) -> Engine:
+        """Engine for a read-only query"""
+        healthy = self._healthy
+        if not healthy or time.monotonic() < self._pinned_until:
+            return self.primary
+        return healthy[next(self._counter) % len(healthy)]
+
+    def pin_primary(self, seconds: float) -> None:
+        """Send reads to the primary for a while, e.g. until replicas can have caught up with a write"""
+        self._pinned_until = max(self._pinned_until, time.monotonic() + seconds)
+
+    def start(self) -> None:
+        """Check replicas now, then keep checking them in the background"""
+        if not self._replicas or self._thread is not None:
+            return
+        self.check()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="replica-health", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._healthy = []
+
+    def check(self) -> None:
+        """Probe every replica and publish the usable ones"""
+        for replica in self._replicas:
+            try:
+                with replica.engine.connect() as connection:
+                    if replica.engine.dialect.name == "postgresql":
+                        lag = float(connection.execute(_POSTGRES_LAG).scalar_one())
+                    else:
+                        connection.execute(text("SELECT 1"))
+                        lag = 0.0
+                if math.isinf(lag):
+                    if replica.healthy:
+                        logger.warning("Replica %s is not streaming from the primary", replica.engine.url.host)
+                    replica.healthy, replica.lag, replica.error = False, None, "WAL receiver is not streaming"
+                    continue
+                replica.lag = lag
+                replica.error = None
+                replica.healthy = replica.lag <= self.max_lag
+            except Exception as e:
+                if replica.healthy:
+                    logger.warning("Replica %s is unavailable: %s", replica.engine.url.host, e)
+                replica.healthy, replica.lag, replica.error = False, None, str(e)
+        self._healthy = [replica.engine for replica in self._replicas if replica.healthy]
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "pinned_to_primary": time.monotonic() < self._pinned_until,
+            "replicas": [
+                {
+                    "host": replica.engine.url.host,
+                    "database": replica.engine.url.database,
+                    "healthy": replica.healthy,
+                    "lag_seconds": replica.lag,
+                    "error": replica.error,
+                }
+                for replica in self._replicas
+            ],
+        }
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            self.check()
@@ -0,0 +1,169 @@
+import math
+import re
+import threading
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy import text
+from sqlmodel import Session, select
+from app.config import settings
+from app.models import Platform, Action, Template
+from app.schemas.search import SearchResult
+from app.core.catalog_events import on_catalog_change
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+_JINJA_TAG = re.compile(r"{%.*?%}", re.S)
+
+# Field weights for the in-process index: names outrank descriptions, which outrank template text
+NAME_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 2.0
+TEMPLATE_WEIGHT = 1.0
+
+# Document expressions match the GIN indexes created by migration 3f1a9c2d7e45
+_POSTGRES_SEARCH = text("""
+    WITH query AS (SELECT plainto_tsquery('english', :q) AS q)
+    SELECT 'platform' AS type, p.id, p.id AS platform_id, p.name, p.slug, p.description,
+           ts_rank(to_tsvector('english', coalesce(p.name, '') || ' ' || coalesce(p.description, '')), query.q) AS score
+    FROM platforms p, query
+    WHERE p.is_active
+      AND to_tsvector('english', coalesce(p.name, '') || ' ' || coalesce(p.description, '')) @@ query.q
+    UNION ALL
+    SELECT 'action' AS type, a.id, a.platform_id, a.name, a.slug, a.description, max(m.score) AS score
+    FROM (
+        SELECT id AS action_id,
+               ts_rank(to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')), query.q) AS score
+        FROM actions, query
+        WHERE to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, '')) @@ query.q
+        UNION ALL
+        SELECT action_id, ts_rank(to_tsvector('english', content), query.q) AS score
+        FROM templates, query
+        WHERE is_active AND to_tsvector('english', content) @@ query.q
+    ) m
+    JOIN actions a ON a.id = m.action_id
+    JOIN platforms ap ON ap.id = a.platform_id
+    WHERE a.is_active AND ap.is_active
+    GROUP BY a.id
+    ORDER BY score DESC, type, id
+    LIMIT :limit
+""")
+
+DocumentKey = Tuple[str, int]
+
+
+def tokenize(value: Optional[str]) -> List[str]:
+    """Split text into lowercase search terms"""
+    if not value:
+        return []
+    return [token for token in _TOKEN.findall(value.lower()) if len(token) > 1]
+
+
+class InvertedIndex:
+    """In-process inverted index over active platforms, actions and templates"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._state: Optional[Tuple[Dict[DocumentKey, dict], Dict[str, Dict[DocumentKey, float]]]] = None
+
+    def search(self, session: Session, query: str, limit: int) -> List[SearchResult]:
+        """Return documents containing every query term, ranked by weighted TF-IDF"""
+        documents, postings = self._snapshot(session)
+        terms = set(tokenize(query))
+        if not terms or any(term not in postings for term in terms):
+            return []
+
+        matches = set.intersection(*(set(postings[term]) for term in terms))
+        total = len(documents)
+        scored = [
+            (sum(postings[term][key] * math.log(1 + total / len(postings[term])) for term in terms), key)
+            for key in matches
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+
+        return [
+            SearchResult(**documents[key], score=round(score, 4))
+            for score, key in scored[:limit]
+        ]
+
+    def invalidate(self) -> None:
+        """Drop the index so the next search rebuilds it"""
+        with self._lock:
+            self._generation += 1
+            self._state = None
+
+    def _snapshot(self, session: Session):
+        """Return the current index, building it from the database if needed"""
+        with self._lock:
+            if self._state is not None:
+                return self._state
+            generation = self._generation
+
+        state = self._build(session)
+
+        with self._lock:
+            if generation == self._generation:
+                self._state = state
+        return state
+
+    def _build(self, session: Session):
+        """Load searchable text and build term -> document weight postings"""
+        documents: Dict[DocumentKey, dict] = {}
+        postings: Dict[str, Dict[DocumentKey, float]] = defaultdict(lambda: defaultdict(float))
+
+        def add(key: DocumentKey, value: Optional[str], weight: float) -> None:
+            for token in tokenize(value):
+                postings[token][key] += weight
+
+        platforms = session.exec(
+            select(Platform.id, Platform.name, Platform.slug, Platform.description)
+            .where(Platform.is_active == True)
+        )
+        for id, name, slug, description in platforms:
+            key = ("platform", id)
+            documents[key] = dict(type="platform", id=id, platform_id=id, name=name, slug=slug, description=description)
+            add(key, name, NAME_WEIGHT)
+            add(key, description, DESCRIPTION_WEIGHT)
+
+        # Actions of deactivated platforms are hidden along with their platform
+        actions = session.exec(
+            select(Action.id, Action.platform_id, Action.name, Action.slug, Action.description)
+            .join(Platform, Platform.id == Action.platform_id)
+            .where(Action.is_active == True, Platform.is_active == True)
+        )
+        for id, platform_id, name, slug, description in actions:
+            key = ("action", id)
+            documents[key] = dict(type="action", id=id, platform_id=platform_id, name=name, slug=slug, description=description)
+            add(key, name, NAME_WEIGHT)
+            add(key, description, DESCRIPTION_WEIGHT)
+
+        # Template matches are reported as their action; Jinja control tags are not content
+        templates = session.exec(select(Template.action_id, Template.content).where(Template.is_active == True))
+        for action_id, content in templates:
+            key = ("action", action_id)
+            if key in documents:
+                add(key, _JINJA_TAG.sub(" ", content), TEMPLATE_WEIGHT)
+
+        return documents, {term: dict(weights) for term, weights in postings.items()}
+
+
+inverted_index = InvertedIndex()
+
+
+def _use_postgres(session: Session) -> bool:
+    """Decide which search backend serves this session"""
+    if settings.search_backend == "auto":
+        return session.get_bind().dialect.name == "postgresql"
+    return settings.search_backend == "postgres"
+
+
+def search_catalog(session: Session, query: str, limit: int) -> List[SearchResult]:
+    """Search platform and action names, descriptions and template content"""
+    if _use_postgres(session):
+        rows = session.exec(_POSTGRES_SEARCH, params={"q": query, "limit": limit}).mappings()
+        return [SearchResult(**row) for row in rows]
+    return inverted_index.search(session, query, limit)
+
+
+@on_catalog_change
+def _invalidate_inverted_index(tables: Set[str]) -> None:
+    if tables & {"platforms", "actions", "templates"}:
+        inverted_index.invalidate()
@@ -0,0 +1,62 @@
+import threading
+from typing import Dict, Optional, Set, Tuple
+from app.database import read_router
+from app.core.statements import PLATFORM_SLUGS, ACTION_SLUGS
+from app.core.catalog_events import on_catalog_change
+
+
+class SlugIndex:
+    """In-process slug -> id lookup for platforms and actions"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._platforms: Optional[Dict[str, int]] = None
+        self._actions: Dict[Tuple[int, str], int] = {}
+
+    def platform_id(self, slug: str) -> Optional[int]:
+        """Resolve a platform slug to its ID"""
+        platforms, _ = self._snapshot()
+        return platforms.get(slug)
+
+    def action_id(self, platform_id: int, slug: str) -> Optional[int]:
+        """Resolve an action slug within a platform to its ID"""
+        _, actions = self._snapshot()
+        return actions.get((platform_id, slug))
+
+    def invalidate(self) -> None:
+        """Drop the index so the next lookup reloads it"""
+        with self._lock:
+            self._generation += 1
+            self._platforms = None
+            self._actions = {}
+
+    def _snapshot(self) -> Tuple[Dict[str, int], Dict[Tuple[int, str], int]]:
+        """Return the current index, loading it from the database if needed"""
+        with self._lock:
+            if self._platforms is not None:
+                return self._platforms, self._actions
+            generation = self._generation
+
+        # Action slugs are only unique within a platform
+        with read_router.read_engine().connect() as connection:
+            platforms = {slug: id for id, slug in connection.execute(PLATFORM_SLUGS)}
+            actions = {
+                (platform_id, slug): id
+                for id, platform_id, slug in connection.execute(ACTION_SLUGS)
+            }
+
+        with self._lock:
+            # Don't publish a snapshot that was invalidated while loading
+            if generation == self._generation:
+                self._platforms, self._actions = platforms, actions
+        return platforms, actions
+
+
+slug_index = SlugIndex()
+
+
+@on_catalog_change
+def _invalidate_slug_index(tables: Set[str]) -> None:
+    if tables & {"platforms", "actions"}:
+        slug_index.invalidate()
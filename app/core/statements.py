@@ -0,0 +1,52 @@
+from sqlalchemy import bindparam
+from sqlmodel import select
+from app.core.records import PLATFORM_COLUMNS, ACTION_COLUMNS, VARIABLE_COLUMNS, TEMPLATE_COLUMNS
+from app.models import Platform, Action, Variable, Template, TemplateVersion
+
+# The fixed query set, built once at import with bound parameters. Executing
+# the same statement object skips rebuilding the select() and lets SQLAlchemy
+# reuse its compiled SQL; pass values as execute() parameters, e.g.
+# connection.execute(ACTION_BY_ID, {"action_id": 1}). psycopg2 has no
+# server-side prepare, but the SQL text is identical on every call, so a
+# driver that prepares automatically (psycopg 3) would reuse one prepared
+# statement per query.
+
+# Catalog lookups (app.core.catalog)
+PLATFORM_BY_ID = select(*PLATFORM_COLUMNS).where(Platform.id == bindparam("platform_id"))
+
+ACTION_BY_ID = select(*ACTION_COLUMNS).where(Action.id == bindparam("action_id"))
+
+VARIABLES_BY_ACTION = select(*VARIABLE_COLUMNS).where(
+    Variable.action_id == bindparam("action_id")
+).order_by(Variable.order, Variable.id)
+
+ACTIVE_TEMPLATE_BY_ACTION = select(*TEMPLATE_COLUMNS).join(
+    Template, Template.active_version_id == TemplateVersion.id
+).where(
+    Template.action_id == bindparam("action_id"),
+    Template.is_active == True
+)
+
+# Action detail responses, the only catalog reads that need timestamps
+ACTION_ENTITY_BY_ID = select(Action).where(Action.id == bindparam("action_id"))
+
+VARIABLE_ENTITIES_BY_ACTION = select(Variable).where(
+    Variable.action_id == bindparam("action_id")
+).order_by(Variable.order, Variable.id)
+
+# Slug index (app.core.slug_index)
+PLATFORM_SLUGS = select(Platform.id, Platform.slug)
+
+ACTION_SLUGS = select(Action.id, Action.platform_id, Action.slug)
+
+# Route handlers
+PLATFORM_EXISTS = select(Platform.id).where(Platform.id == bindparam("platform_id"))
+
+ACTION_EXISTS = select(Action.id).where(Action.id == bindparam("action_id"))
+
+PLATFORM_ENTITY_BY_ID = select(Platform).where(Platform.id == bindparam("platform_id"))
+
+ACTIVE_PLATFORM_ACTIONS = select(Action).where(
+    Action.platform_id == bindparam("platform_id"),
+    Action.is_active == True
+).order_by(Action.id).limit(bindparam("limit"))
@@ -0,0 +1,58 @@
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from jinja2 import Environment, Template as Jinja2Template
+
+
+class CompiledTemplateCache:
+    """
+    Compiled Jinja templates keyed by template version ID
+
+    Versions are immutable, so an entry never goes stale and needs no
+    invalidation; the LRU bound only caps memory.
+    """
+
+    def __init__(self, max_entries: int = 1024, enable_async: bool = False):
+        self.max_entries = max_entries
+        self.enable_async = enable_async
+        self._environment: Optional["Environment"] = None
+        self._lock = threading.Lock()
+        self._templates: "OrderedDict[int, Jinja2Template]" = OrderedDict()
+
+    @property
+    def environment(self) -> "Environment":
+        """The Jinja environment, created on first compile to keep jinja2 off the startup path"""
+        if self._environment is None:
+            from jinja2 import Environment
+            self._environment = Environment(enable_async=self.enable_async)
+        return self._environment
+
+    def get(self, version_id: int, content: str) -> "Jinja2Template":
+        """Return the compiled template for a version, compiling it on first use"""
+        with self._lock:
+            template = self._templates.get(version_id)
+            if template is not None:
+                self._templates.move_to_end(version_id)
+                return template
+
+        # Compile outside the lock; a concurrent duplicate compile is harmless
+        template = self.environment.from_string(content)
+
+        with self._lock:
+            self._templates[version_id] = template
+            self._templates.move_to_end(version_id)
+            while len(self._templates) > self.max_entries:
+                self._templates.popitem(last=False)
+        return template
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+
+
+compiled_templates = CompiledTemplateCache()
+
+# Templates compiled for render_async()/generate_async()
+async_compiled_templates = CompiledTemplateCache(enable_async=True)
@@ -1,5 +1,13 @@
+import ast
+from pathlib import Path
+from typing import Generator, Set
+from sqlalchemy import inspect, text
 from sqlmodel import create_engine, SQLModel, Session
 from app.config import settings
+from app.core.catalog_events import on_catalog_change
+from app.core.replicas import ReplicaRouter
+
+ALEMBIC_DIR = Path(__file__).resolve().parent.parent / "alembic"
 
 # Create database engine
 engine = create_engine(
@@ -8,13 +16,73 @@ engine = create_engine(
     pool_pre_ping=True,   # Verify connections before use
 )
 
+# Read replicas; read-only routes and catalog lookups pick one through read_router
+replica_engines = [
+    create_engine(url, echo=settings.debug, pool_pre_ping=True)
+    for url in settings.database_replica_urls
+]
+read_router = ReplicaRouter(
+    engine, replica_engines, settings.replica_max_lag, settings.replica_health_check_interval
+)
+
+
+@on_catalog_change
+def _pin_reads_to_primary(tables: Set[str]) -> None:
+    # Caches reload right after a change; don't let them reload from a replica that hasn't replayed it
+    if replica_engines:
+        read_router.pin_primary(settings.replica_max_lag)
+
 
 def create_db_and_tables():
     """Create database tables"""
     SQLModel.metadata.create_all(engine)
 
 
-def get_session():
+def _alembic_heads() -> Set[str]:
+    """Read the head revisions from the migration scripts without importing Alembic"""
+    revisions, parents = set(), set()
+    for path in (ALEMBIC_DIR / "versions").glob("*.py"):
+        for node in ast.parse(path.read_text()).body:
+            if isinstance(node, ast.AnnAssign):
+                target = node.target
+            elif isinstance(node, ast.Assign) and len(node.targets) == 1:
+                target = node.targets[0]
+            else:
+                continue
+            if not isinstance(target, ast.Name) or target.id not in ("revision", "down_revision"):
+                continue
+            value = ast.literal_eval(node.value)
+            if target.id == "revision":
+                revisions.add(value)
+            elif value:
+                parents.update([value] if isinstance(value, str) else value)
+    return revisions - parents
+
+
+def check_schema_revision():
+    """Fail fast unless the database is at the Alembic head revision"""
+    # Importing alembic loads DDL support for every dialect, so the check reads
+    # the scripts and the alembic_version table directly
+    expected = _alembic_heads()
+    with engine.connect() as connection:
+        current = set()
+        if inspect(connection).has_table("alembic_version"):
+            current = set(connection.execute(text("SELECT version_num FROM alembic_version")).scalars())
+
+    if current != expected:
+        raise RuntimeError(
+            f"Database schema is at revision {', '.join(sorted(current)) or 'none'}, "
+            f"expected {', '.join(sorted(expected))}; run `alembic upgrade head`"
+        )
+
+
+def get_session() -> Generator[Session, None, None]:
     """Dependency to get database session"""
     with Session(engine) as session:
         yield session
+
+
+def get_read_session() -> Generator[Session, None, None]:
+    """Dependency to get a session for read-only routes, on a replica when one is usable"""
+    with Session(read_router.read_engine()) as session:
+        yield session
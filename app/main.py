@@ -1,19 +1,68 @@
+import threading
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse
 from fastapi.openapi.utils import get_openapi
 from app.config import settings
-from app.database import create_db_and_tables
+from app.core.admission import AdmissionControlMiddleware, admission_routes
+from app.core.hotset import hot_set
+from app.core.profiling import ProfilingMiddleware, profile_store
+from app.database import check_schema_revision, create_db_and_tables, engine, read_router
+from app.services.catalog_listener import CatalogListener
+from app.services.conversion_log import conversion_log
+from app.services.hotset import HotSetPersister, start_prewarm, warmed
+from app.services.jobs import JobWorkerPool, job_queue
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan event handler"""
     # Startup
-    create_db_and_tables()
+    if settings.startup_mode == "production":
+        # Alembic owns the schema; only confirm migrations have been applied
+        check_schema_revision()
+        # Build the OpenAPI document off the request path
+        threading.Thread(target=app.openapi, name="openapi-prebuild", daemon=True).start()
+    else:
+        create_db_and_tables()
+
+    # Start health-checking read replicas; reads use the primary until one passes
+    read_router.start()
+
+    # Evict in-process caches when other workers or nodes change the catalog
+    listener = None
+    if settings.catalog_listener_enabled and engine.dialect.name == "postgresql":
+        listener = CatalogListener(engine, settings.catalog_version_check_interval)
+        listener.start()
+
+    # Warm the caches for the actions that were busiest before the restart
+    hot_set.load(settings.hotset_path)
+    start_prewarm(hot_set, settings.hotset_prewarm_top)
+    hotset_persister = HotSetPersister(hot_set, settings.hotset_path, settings.hotset_persist_interval)
+    hotset_persister.start()
+
+    # Record generated prompts off the request path
+    if settings.conversion_log_enabled:
+        conversion_log.start()
+
+    # Run bulk conversion jobs in this process unless dedicated workers do it
+    job_workers = None
+    if settings.jobs_workers > 0:
+        job_workers = JobWorkerPool(job_queue, settings.jobs_workers, settings.jobs_chunk_size, settings.jobs_stale_after)
+        job_workers.start()
     
     yield
-    # Shutdown (if needed)
+    # Shutdown
+    if job_workers is not None:
+        job_workers.stop()
+    # After the job workers, so rows they recorded while stopping are flushed too
+    conversion_log.stop()
+    hotset_persister.stop()
+    read_router.stop()
+    if listener is not None:
+        listener.stop()
 
 
 def create_application() -> FastAPI:
@@ -26,6 +75,15 @@ def create_application() -> FastAPI:
         lifespan=lifespan,
     )
 
+    # Shed load per route class before it queues in the threadpool; added
+    # first so it sits inside CORS and 503s still carry CORS headers
+    if settings.admission_control_enabled:
+        app.add_middleware(
+            AdmissionControlMiddleware,
+            routes=admission_routes,
+            retry_after=settings.admission_retry_after,
+        )
+
     # Set up CORS middleware
     app.add_middleware(
         CORSMiddleware,
@@ -35,6 +93,22 @@ def create_application() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Opt-in request profiling; a header lookup per request when not triggered
+    app.add_middleware(
+        ProfilingMiddleware,
+        store=profile_store,
+        admin_token=settings.admin_token,
+        sample_rate=settings.profiling_sample_rate,
+        interval=settings.profiling_interval,
+    )
+
+    # Compress large responses for clients that send Accept-Encoding: gzip
+    app.add_middleware(
+        GZipMiddleware,
+        minimum_size=settings.gzip_minimum_size,
+        compresslevel=settings.gzip_compress_level,
+    )
+
     return app
 
 
@@ -55,31 +129,42 @@ def root():
 
 @app.get("/health")
 def health_check():
-    """Health check endpoint"""
+    """Health check endpoint; 503 until startup cache prewarming has finished"""
+    if not warmed.is_set():
+        return JSONResponse({"status": "warming"}, status_code=503)
     return {"status": "healthy"}
 
 
 # Import and include API routes
-from app.api.routes import platforms, actions, convert
+from app.api.routes import platforms, actions, convert, jobs, search, admin
 
 app.include_router(platforms.router, prefix=f"{settings.api_v1_str}/platforms", tags=["platforms"])
 app.include_router(actions.router, prefix=f"{settings.api_v1_str}/actions", tags=["actions"])
 app.include_router(convert.router, prefix=f"{settings.api_v1_str}/convert", tags=["convert"])
+app.include_router(jobs.router, prefix=f"{settings.api_v1_str}/convert/jobs", tags=["jobs"])
+app.include_router(search.router, prefix=f"{settings.api_v1_str}/search", tags=["search"])
+app.include_router(admin.router, prefix=f"{settings.api_v1_str}/admin", tags=["admin"])
+
+_openapi_lock = threading.Lock()
 
 def custom_openapi():
     if app.openapi_schema:
         return app.openapi_schema
-    openapi_schema = get_openapi(
-        title="Custom title",
-        version="2.5.0",
-        summary="This is a very custom OpenAPI schema",
-        description="Here's a longer description of the custom **OpenAPI** schema",
-        routes=app.routes,
-    )
-    openapi_schema["info"]["x-logo"] = {
-        "url": "https://fastapi.tiangolo.com/img/logo-margin/logo-teal.png"
-    }
-    app.openapi_schema = openapi_schema
+    # Concurrent first requests wait for one build instead of each building the schema
+    with _openapi_lock:
+        if app.openapi_schema:
+            return app.openapi_schema
+        openapi_schema = get_openapi(
+            title="Custom title",
+            version="2.5.0",
+            summary="This is a very custom OpenAPI schema",
+            description="Here's a longer description of the custom **OpenAPI** schema",
+            routes=app.routes,
+        )
+        openapi_schema["info"]["x-logo"] = {
+            "url": "https://fastapi.tiangolo.com/img/logo-margin/logo-teal.png"
+        }
+        app.openapi_schema = openapi_schema
     return app.openapi_schema
 
 app.openapi = custom_openapi
\ No newline at end of file
@@ -1,15 +1,22 @@
 from .platform import Platform, PlatformCreate, PlatformRead, PlatformReadWithActions, PlatformUpdate
-from .action import Action, ActionCreate, ActionRead, ActionReadWithVariables, ActionUpdate
+from .action import Action, ActionCreate, ActionRead, ActionReadWithVariables, ActionReadWithTemplate, ActionUpdate
 from .variable import Variable, VariableCreate, VariableRead, VariableUpdate, VariableType
-from .template import Template, TemplateCreate, TemplateRead, TemplateUpdate
+from .template import Template, TemplateCreate, TemplateRead, TemplateUpdate, TemplateVersion, TemplateVersionCreate, TemplateVersionRead
+from .conversion_log import ConversionLog
 
 from pydantic import BaseModel
 from sqlmodel import SQLModel
 
+# Resolve forward references between the read models now that all are imported
+PlatformReadWithActions.model_rebuild()
+ActionReadWithVariables.model_rebuild()
+ActionReadWithTemplate.model_rebuild()
 
 __all__ = [
     "Platform", "PlatformCreate", "PlatformRead", "PlatformReadWithActions", "PlatformUpdate",
-    "Action", "ActionCreate", "ActionRead", "ActionReadWithVariables", "ActionUpdate", 
+    "Action", "ActionCreate", "ActionRead", "ActionReadWithVariables", "ActionReadWithTemplate", "ActionUpdate",
     "Variable", "VariableCreate", "VariableRead", "VariableUpdate", "VariableType",
-    "Template", "TemplateCreate", "TemplateRead", "TemplateUpdate"
+    "Template", "TemplateCreate", "TemplateRead", "TemplateUpdate",
+    "TemplateVersion", "TemplateVersionCreate", "TemplateVersionRead",
+    "ConversionLog"
 ]
@@ -0,0 +1,20 @@
+from sqlalchemy import BigInteger, Integer
+from sqlmodel import SQLModel, Field
+from typing import Optional
+from datetime import datetime, timezone
+
+
+class ConversionLog(SQLModel, table=True):
+    """One generated prompt, written in batches by app.services.conversion_log"""
+    __tablename__ = "conversion_logs"
+
+    # SQLite only auto-increments INTEGER primary keys
+    id: Optional[int] = Field(default=None, primary_key=True, sa_type=BigInteger().with_variant(Integer, "sqlite"))
+    # No foreign keys: analytics rows must not slow down or block catalog changes
+    platform_id: int = Field(description="Platform the prompt was generated for")
+    action_id: int = Field(index=True, description="Action the prompt was generated for")
+    variables_hash: str = Field(max_length=64, description="SHA-256 of the canonical JSON variables")
+    prompt_chars: int = Field(description="Length of the generated prompt")
+    latency_ms: float = Field(description="Time to produce the prompt")
+    source: str = Field(max_length=16, description="api, stream, expand or job")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc), index=True)
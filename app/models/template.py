@@ -1,4 +1,4 @@
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, UniqueConstraint
 from typing import Optional
 from datetime import datetime, timezone
 
@@ -13,6 +13,9 @@ class Template(TemplateBase, table=True):
     
     id: Optional[int] = Field(default=None, primary_key=True)
     action_id: int = Field(foreign_key="actions.id", unique=True, description="Associated action ID")
+    active_version_id: Optional[int] = Field(
+        default=None, foreign_key="template_versions.id", description="Currently published template version"
+    )
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     
@@ -27,6 +30,7 @@ class TemplateCreate(TemplateBase):
 class TemplateRead(TemplateBase):
     id: int
     action_id: int
+    active_version_id: Optional[int] = None
     created_at: datetime
     updated_at: datetime
 
@@ -34,3 +38,27 @@ class TemplateRead(TemplateBase):
 class TemplateUpdate(SQLModel):
     content: Optional[str] = None
     is_active: Optional[bool] = None
+
+
+class TemplateVersion(SQLModel, table=True):
+    """Immutable snapshot of a template's content; rows are never updated"""
+    __tablename__ = "template_versions"
+    __table_args__ = (UniqueConstraint("action_id", "version"),)
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    action_id: int = Field(foreign_key="actions.id", index=True, description="Associated action ID")
+    version: int = Field(description="Version number, increasing per action")
+    content: str = Field(description="Template content with placeholders")
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class TemplateVersionCreate(SQLModel):
+    content: str = Field(description="Template content with placeholders")
+
+
+class TemplateVersionRead(SQLModel):
+    id: int
+    action_id: int
+    version: int
+    content: str
+    created_at: datetime
@@ -1,5 +1,8 @@
-from .convert import ConvertRequest, ConvertResponse, ValidationError, ErrorResponse
+from .convert import ConvertRequest, ConvertResponse, ExpandRequest, ValidationError, ErrorResponse
+from .search import SearchResult
+from .jobs import JobRead
 
 __all__ = [
-    "ConvertRequest", "ConvertResponse", "ValidationError", "ErrorResponse"
+    "ConvertRequest", "ConvertResponse", "ExpandRequest", "ValidationError", "ErrorResponse",
+    "SearchResult", "JobRead"
 ]
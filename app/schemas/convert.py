@@ -1,12 +1,29 @@
+from pydantic import model_validator
 from sqlmodel import SQLModel, Field
 from typing import Dict, Any, List, Optional
 
 
 class ConvertRequest(SQLModel):
-    platform_id: int = Field(description="ID of the selected platform")
-    action_id: int = Field(description="ID of the selected action") 
+    platform_id: Optional[int] = Field(default=None, description="ID of the selected platform")
+    action_id: Optional[int] = Field(default=None, description="ID of the selected action")
+    platform_slug: Optional[str] = Field(default=None, description="Slug of the selected platform, instead of platform_id")
+    action_slug: Optional[str] = Field(default=None, description="Slug of the selected action, instead of action_id")
     variables: Dict[str, Any] = Field(description="User-provided variable values")
 
+    @model_validator(mode="after")
+    def check_identifiers(self):
+        """Require either an ID or a slug for both platform and action"""
+        if self.platform_id is None and self.platform_slug is None:
+            raise ValueError("Either platform_id or platform_slug is required")
+        if self.action_id is None and self.action_slug is None:
+            raise ValueError("Either action_id or action_slug is required")
+        return self
+
+
+class ExpandRequest(ConvertRequest):
+    variables: Dict[str, Any] = Field(default_factory=dict, description="Fixed variable values shared by every combination")
+    expand: List[str] = Field(min_length=1, description="Names of select variables to expand over all of their options")
+
 
 class ConvertResponse(SQLModel):
     prompt: str = Field(description="Generated prompt text")
@@ -0,0 +1,16 @@
+from datetime import datetime
+from sqlmodel import SQLModel, Field
+from typing import Optional
+
+
+class JobRead(SQLModel):
+    id: str = Field(description="Job ID")
+    status: str = Field(description="queued, running, completed or failed")
+    total: int = Field(description="Number of requests in the upload")
+    processed: int = Field(description="Requests converted so far")
+    failed: int = Field(description="Requests that produced errors instead of a prompt")
+    progress: float = Field(description="Fraction of requests processed, 0 to 1")
+    error: Optional[str] = Field(default=None, description="Why the job failed, if it did")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
@@ -0,0 +1,12 @@
+from sqlmodel import SQLModel, Field
+from typing import Optional
+
+
+class SearchResult(SQLModel):
+    type: str = Field(description="Result type: platform or action")
+    id: int = Field(description="ID of the platform or action")
+    platform_id: int = Field(description="ID of the platform the result belongs to")
+    name: str = Field(description="Display name")
+    slug: str = Field(description="URL-friendly identifier")
+    description: Optional[str] = Field(default=None, description="Description")
+    score: float = Field(description="Relevance score, higher is better")
@@ -0,0 +1,106 @@
+import json
+import logging
+import select
+import threading
+import time
+from typing import Optional, Tuple
+from sqlalchemy import text
+from sqlalchemy.engine import Engine
+from app.core.catalog_events import CATALOG_TABLES, notify_catalog_change
+
+logger = logging.getLogger(__name__)
+
+# Channel used by the notify_catalog_change() trigger function (migration c47e1f8b2a53)
+CHANNEL = "catalog_changes"
+
+# Cheap fingerprint of catalog contents for the periodic backstop check
+_CATALOG_VERSION = text("""
+    SELECT
+        (SELECT count(*) FROM platforms), (SELECT max(updated_at) FROM platforms),
+        (SELECT count(*) FROM actions), (SELECT max(updated_at) FROM actions),
+        (SELECT count(*) FROM variables), (SELECT max(updated_at) FROM variables),
+        (SELECT count(*) FROM templates), (SELECT max(updated_at) FROM templates)
+""")
+
+
+class CatalogListener:
+    """
+    Evict in-process catalog caches when any process changes the catalog
+
+    A background thread LISTENs for trigger notifications and forwards the
+    changed table names to catalog_events listeners. Every
+    `version_check_interval` seconds it also compares a catalog fingerprint,
+    so a missed notification costs at most one interval of staleness.
+    """
+
+    def __init__(self, engine: Engine, version_check_interval: float = 30.0, poll_timeout: float = 1.0):
+        self.engine = engine
+        self.version_check_interval = version_check_interval
+        self.poll_timeout = poll_timeout
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._version: Optional[Tuple] = None
+
+    def start(self) -> None:
+        """Start the listener thread"""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="catalog-listener", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the listener thread and close its connection"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Catalog listener failed, reconnecting")
+                # Notifications may have been missed while disconnected
+                notify_catalog_change(CATALOG_TABLES)
+                self._stop.wait(self.poll_timeout * 5)
+
+    def _listen(self) -> None:
+        """Hold one LISTEN connection and dispatch notifications until stopped"""
+        raw = self.engine.raw_connection()
+        try:
+            connection = raw.driver_connection
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {CHANNEL}")
+
+            last_check = time.monotonic()
+            self._version = self._catalog_version()
+
+            while not self._stop.is_set():
+                if select.select([connection], [], [], self.poll_timeout) != ([], [], []):
+                    connection.poll()
+                    tables = set()
+                    while connection.notifies:
+                        notification = connection.notifies.pop(0)
+                        tables.add(json.loads(notification.payload)["table"])
+                    if tables:
+                        notify_catalog_change(tables)
+
+                if time.monotonic() - last_check >= self.version_check_interval:
+                    last_check = time.monotonic()
+                    self._check_version()
+        finally:
+            raw.invalidate()
+
+    def _check_version(self) -> None:
+        """Invalidate everything if the catalog changed without a notification"""
+        version = self._catalog_version()
+        if version != self._version:
+            self._version = version
+            notify_catalog_change(CATALOG_TABLES)
+
+    def _catalog_version(self) -> Tuple:
+        with self.engine.connect() as connection:
+            return tuple(connection.execute(_CATALOG_VERSION).one())
@@ -0,0 +1,183 @@
+import csv
+import io
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from sqlalchemy.engine import Engine
+from app.config import settings
+from app.core.singleflight import request_key
+from app.database import engine
+from app.models import ConversionLog
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = ("platform_id", "action_id", "variables_hash", "prompt_chars", "latency_ms", "source", "created_at")
+
+# platform_id, action_id, variables, prompt_chars, latency_ms, source, created_at
+_Entry = Tuple[int, int, Dict[str, Any], int, float, str, datetime]
+
+
+class ConversionLogWriter:
+    """
+    Write-behind buffer for conversion log rows
+
+    record() only appends to an in-memory buffer; a background thread
+    writes batches of `batch_size` rows, or whatever is buffered every
+    `flush_interval` seconds, with COPY on Postgres and a multi-row INSERT
+    elsewhere. The buffer holds at most `max_buffer` rows. When it is full,
+    the "drop" policy discards the new row and "block" makes the caller wait
+    up to `block_timeout` for the writer to catch up before dropping it.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        batch_size: int,
+        flush_interval: float,
+        max_buffer: int,
+        overflow: str = "drop",
+        block_timeout: float = 0.1
+    ):
+        self.engine = engine
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_buffer = max_buffer
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self._buffer: Deque[_Entry] = deque()
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+        self.batches = 0
+
+    def start(self) -> None:
+        """Start the writer thread; record() is a no-op until then"""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="conversion-log-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Flush everything buffered and stop the writer thread"""
+        if self._thread is None:
+            return
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout)
+        self._thread = None
+
+    def record(
+        self,
+        platform_id: int,
+        action_id: int,
+        variables: Dict[str, Any],
+        prompt_chars: int,
+        latency: float,
+        source: str,
+        wait: bool = True
+    ) -> None:
+        """
+        Buffer one generated prompt
+
+        Variables are hashed on the writer thread, not here. Pass
+        `wait=False` from the event loop so the "block" policy never stalls it.
+        """
+        if self._thread is None:
+            return
+        entry = (platform_id, action_id, variables, prompt_chars, latency * 1000, source, datetime.now(timezone.utc))
+        with self._cond:
+            if len(self._buffer) >= self.max_buffer and self.overflow == "block" and wait:
+                self._cond.notify_all()
+                self._cond.wait_for(lambda: len(self._buffer) < self.max_buffer, self.block_timeout)
+            if len(self._buffer) >= self.max_buffer:
+                self.dropped += 1
+                return
+            self._buffer.append(entry)
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "running": self._thread is not None,
+            "buffered": len(self._buffer),
+            "max_buffer": self.max_buffer,
+            "overflow": self.overflow,
+            "written": self.written,
+            "batches": self.batches,
+            "dropped": self.dropped,
+            "failed": self.failed,
+        }
+
+    def _run(self) -> None:
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: self._stopping or len(self._buffer) >= self.batch_size,
+                    max(deadline - time.monotonic(), 0)
+                )
+                batch = [self._buffer.popleft() for _ in range(min(self.batch_size, len(self._buffer)))]
+                done = self._stopping and not self._buffer
+                # Wake callers waiting for room under the "block" policy
+                self._cond.notify_all()
+
+            if batch:
+                self._write(batch)
+            if done:
+                return
+            if not batch or len(batch) < self.batch_size:
+                deadline = time.monotonic() + self.flush_interval
+
+    def _write(self, batch: List[_Entry]) -> None:
+        rows = [
+            (platform_id, action_id, request_key(variables), prompt_chars, latency_ms, source, created_at)
+            for platform_id, action_id, variables, prompt_chars, latency_ms, source, created_at in batch
+        ]
+        try:
+            if self.engine.dialect.name == "postgresql":
+                self._copy(rows)
+            else:
+                with self.engine.begin() as connection:
+                    connection.execute(insert(ConversionLog.__table__), [dict(zip(_COLUMNS, row)) for row in rows])
+        except Exception:
+            logger.exception("Could not write %d conversion log rows", len(rows))
+            self.failed += len(rows)
+            return
+        self.written += len(rows)
+        self.batches += 1
+
+    def _copy(self, rows: List[tuple]) -> None:
+        """Stream rows into Postgres with COPY, the cheapest bulk load path"""
+        data = io.StringIO()
+        csv.writer(data).writerows(
+            (*row[:-1], row[-1].isoformat()) for row in rows
+        )
+        data.seek(0)
+        raw = self.engine.raw_connection()
+        try:
+            with raw.cursor() as cursor:
+                cursor.copy_expert(
+                    f"COPY {ConversionLog.__tablename__} ({', '.join(_COLUMNS)}) FROM STDIN WITH (FORMAT csv)",
+                    data
+                )
+            raw.commit()
+        finally:
+            raw.close()
+
+
+conversion_log = ConversionLogWriter(
+    engine,
+    settings.conversion_log_batch_size,
+    settings.conversion_log_flush_interval,
+    settings.conversion_log_max_buffer,
+    settings.conversion_log_overflow,
+)
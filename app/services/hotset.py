@@ -0,0 +1,85 @@
+import logging
+import threading
+from typing import Iterable, Optional
+from app.core import catalog
+from app.core.hotset import HotSet
+from app.core.slug_index import slug_index
+from app.core.template_cache import compiled_templates
+
+logger = logging.getLogger(__name__)
+
+# Set once startup prewarming has finished (or was skipped); /health reports 503 until then
+warmed = threading.Event()
+
+
+def prewarm(action_ids: Iterable[int]) -> int:
+    """Load the catalog entries, variable rules and compiled templates of these actions; returns how many were found"""
+    count = 0
+    for action_id in action_ids:
+        action = catalog.get_action(action_id)
+        if not action:
+            continue
+        platform = catalog.get_platform(action.platform_id)
+        if platform:
+            slug_index.platform_id(platform.slug)
+        catalog.get_variables(action_id)
+        template = catalog.get_active_template(action_id)
+        if template:
+            compiled_templates.get(template.id, template.content)
+        count += 1
+    return count
+
+
+def start_prewarm(hot_set: HotSet, top: int) -> None:
+    """Prewarm the `top` hottest actions in the background, then set `warmed`"""
+    def run():
+        try:
+            count = prewarm(action_id for action_id, _ in hot_set.top(top))
+            logger.info("Prewarmed caches for %d hot actions", count)
+        except Exception:
+            # A cold cache is slower, not broken; report healthy anyway
+            logger.exception("Cache prewarming failed")
+        finally:
+            warmed.set()
+
+    warmed.clear()
+    if top <= 0:
+        warmed.set()
+        return
+    threading.Thread(target=run, name="cache-prewarm", daemon=True).start()
+
+
+class HotSetPersister:
+    """Saves the hot set every `interval` seconds and once more on stop"""
+
+    def __init__(self, hot_set: HotSet, path: str, interval: float):
+        self.hot_set = hot_set
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="hotset-persister", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._save()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._save()
+
+    def _save(self) -> None:
+        try:
+            self.hot_set.save(self.path)
+        except Exception:
+            # Keep the persister thread alive; the next interval tries again
+            logger.exception("Could not save the hot set to %s", self.path)
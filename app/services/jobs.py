@@ -0,0 +1,310 @@
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Protocol, TextIO, Tuple
+from pydantic import ValidationError as RequestError
+from app.config import settings
+from app.core import catalog
+from app.core.converter import PromptConverter
+from app.core.slug_index import slug_index
+from app.services.conversion_log import conversion_log
+from app.schemas.convert import ConvertRequest
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class Job:
+    """A conversion job as stored in the queue; times are epoch seconds"""
+    id: str
+    status: str
+    input_path: str
+    output_path: str
+    total: int
+    processed: int = 0
+    failed: int = 0
+    error: Optional[str] = None
+    created_at: float = 0.0
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    heartbeat_at: Optional[float] = None
+
+    def read(self) -> Dict[str, Any]:
+        """Fields exposed by the jobs API"""
+        def as_datetime(value: Optional[float]) -> Optional[datetime]:
+            return datetime.fromtimestamp(value, timezone.utc) if value is not None else None
+
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total": self.total,
+            "processed": self.processed,
+            "failed": self.failed,
+            "progress": self.processed / self.total if self.total else 1.0,
+            "error": self.error,
+            "created_at": as_datetime(self.created_at),
+            "started_at": as_datetime(self.started_at),
+            "finished_at": as_datetime(self.finished_at),
+        }
+
+
+class JobQueue(Protocol):
+    """Where jobs wait and report progress; shared by the API and every worker"""
+
+    def enqueue(self, job: Job) -> None: ...
+
+    def claim(self, stale_after: float) -> Optional[Job]: ...
+
+    def heartbeat(self, job_id: str, processed: int, failed: int) -> None: ...
+
+    def finish(self, job_id: str, error: Optional[str] = None) -> None: ...
+
+    def requeue(self, job_id: str) -> None: ...
+
+    def get(self, job_id: str) -> Optional[Job]: ...
+
+
+class SQLiteJobQueue:
+    """
+    Job queue in a local SQLite file
+
+    Safe to share between threads and between processes on one host;
+    claims take a write lock so each job goes to exactly one worker.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ready = False
+        self._lock = threading.Lock()
+
+    def enqueue(self, job: Job) -> None:
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "INSERT INTO jobs (id, status, input_path, output_path, total, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (job.id, job.status, job.input_path, job.output_path, job.total, job.created_at)
+            )
+
+    def claim(self, stale_after: float) -> Optional[Job]:
+        """Take the oldest queued job, or a running one whose worker stopped sending heartbeats"""
+        now = time.time()
+        with closing(self._connect()) as db, db:
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute(
+                "SELECT * FROM jobs WHERE status = 'queued' OR (status = 'running' AND heartbeat_at < ?) "
+                "ORDER BY created_at LIMIT 1",
+                (now - stale_after,)
+            ).fetchone()
+            if row is None:
+                return None
+            db.execute(
+                "UPDATE jobs SET status = 'running', processed = 0, failed = 0, started_at = ?, heartbeat_at = ? "
+                "WHERE id = ?",
+                (now, now, row["id"])
+            )
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: str, processed: int, failed: int) -> None:
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "UPDATE jobs SET processed = ?, failed = ?, heartbeat_at = ? WHERE id = ?",
+                (processed, failed, time.time(), job_id)
+            )
+
+    def finish(self, job_id: str, error: Optional[str] = None) -> None:
+        with closing(self._connect()) as db, db:
+            db.execute(
+                "UPDATE jobs SET status = ?, error = ?, finished_at = ? WHERE id = ?",
+                ("failed" if error else "completed", error, time.time(), job_id)
+            )
+
+    def requeue(self, job_id: str) -> None:
+        with closing(self._connect()) as db, db:
+            db.execute("UPDATE jobs SET status = 'queued', started_at = NULL WHERE id = ?", (job_id,))
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with closing(self._connect()) as db:
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return Job(**dict(row)) if row else None
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Autocommit mode; claim() opens its own BEGIN IMMEDIATE transaction
+        db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+        db.row_factory = sqlite3.Row
+        if not self._ready:
+            with self._lock:
+                db.execute("""
+                    CREATE TABLE IF NOT EXISTS jobs (
+                        id TEXT PRIMARY KEY,
+                        status TEXT NOT NULL,
+                        input_path TEXT NOT NULL,
+                        output_path TEXT NOT NULL,
+                        total INTEGER NOT NULL,
+                        processed INTEGER NOT NULL DEFAULT 0,
+                        failed INTEGER NOT NULL DEFAULT 0,
+                        error TEXT,
+                        created_at REAL NOT NULL,
+                        started_at REAL,
+                        finished_at REAL,
+                        heartbeat_at REAL
+                    )
+                """)
+                db.execute("CREATE INDEX IF NOT EXISTS ix_jobs_status_created_at ON jobs (status, created_at)")
+                self._ready = True
+        return db
+
+
+def create_job_queue(url: Optional[str]) -> JobQueue:
+    """Build the configured job queue; defaults to a SQLite file in JOBS_DIR"""
+    url = url or f"sqlite:///{os.path.join(settings.jobs_dir, 'jobs.db')}"
+    if url.startswith("sqlite:///"):
+        return SQLiteJobQueue(url[len("sqlite:///"):])
+    raise ValueError(f"Unsupported job queue URL: {url}")
+
+
+def submit_job(queue: JobQueue, upload: BinaryIO) -> Job:
+    """Store an NDJSON upload, one convert request per line, and queue it"""
+    os.makedirs(settings.jobs_dir, exist_ok=True)
+    job_id = uuid.uuid4().hex
+    input_path = os.path.join(settings.jobs_dir, f"{job_id}.input.ndjson")
+    output_path = os.path.join(settings.jobs_dir, f"{job_id}.output.ndjson")
+
+    total = 0
+    with open(input_path, "wb") as f:
+        for line in upload:
+            if line.strip():
+                total += 1
+            f.write(line)
+
+    if total == 0:
+        os.remove(input_path)
+        raise ValueError("Upload contains no requests")
+
+    job = Job(job_id, "queued", input_path, output_path, total, created_at=time.time())
+    queue.enqueue(job)
+    return job
+
+
+def _requests(source: TextIO) -> Iterator[Tuple[int, str]]:
+    for line_number, line in enumerate(source, 1):
+        if line.strip():
+            yield line_number, line
+
+
+def convert_line(converter: PromptConverter, line_number: int, line: str) -> Dict[str, Any]:
+    """Convert one NDJSON request into its result line"""
+    started = time.perf_counter()
+    try:
+        request = ConvertRequest.model_validate_json(line)
+    except RequestError as e:
+        message = "; ".join(error["msg"] for error in e.errors())
+        return {"line": line_number, "errors": [{"field": "request", "message": message}]}
+
+    platform_id = request.platform_id
+    if platform_id is None:
+        platform_id = slug_index.platform_id(request.platform_slug)
+    action_id = request.action_id
+    if action_id is None and platform_id is not None:
+        action_id = slug_index.action_id(platform_id, request.action_slug)
+
+    if not catalog.get_platform(platform_id):
+        return {"line": line_number, "errors": [{"field": "platform", "message": "Platform not found"}]}
+    if not catalog.get_action(action_id):
+        return {"line": line_number, "errors": [{"field": "action", "message": "Action not found"}]}
+
+    prompt, errors = converter.convert_to_prompt(platform_id, action_id, request.variables, cache=False)
+    if errors:
+        return {"line": line_number, "errors": [error.model_dump() for error in errors]}
+    conversion_log.record(platform_id, action_id, request.variables, len(prompt), time.perf_counter() - started, "job")
+    return {"line": line_number, "prompt": prompt}
+
+
+def run_job(queue: JobQueue, job: Job, chunk_size: int, stop: Optional[threading.Event] = None) -> bool:
+    """
+    Convert a job's requests in chunks, writing one result line per request
+
+    Progress is reported after each chunk. Returns False if `stop` was set
+    before the job finished; the caller should requeue it.
+    """
+    converter = PromptConverter()
+    processed = failed = 0
+    with open(job.input_path, encoding="utf-8") as source, open(job.output_path, "w", encoding="utf-8") as out:
+        requests = _requests(source)
+        while True:
+            if stop is not None and stop.is_set():
+                return False
+            chunk: List[Tuple[int, str]] = list(islice(requests, chunk_size))
+            if not chunk:
+                break
+            for line_number, line in chunk:
+                result = convert_line(converter, line_number, line)
+                failed += "errors" in result
+                out.write(json.dumps(result) + "\n")
+            processed += len(chunk)
+            out.flush()
+            queue.heartbeat(job.id, processed, failed)
+
+    os.remove(job.input_path)
+    return True
+
+
+class JobWorkerPool:
+    """Threads that claim jobs from the queue and run them until stopped"""
+
+    def __init__(self, queue: JobQueue, workers: int, chunk_size: int, stale_after: float, poll_interval: float = 1.0):
+        self.queue = queue
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.stale_after = stale_after
+        self.poll_interval = poll_interval
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+    def start(self) -> None:
+        """Start the worker threads"""
+        if self._threads:
+            return
+        self._stop.clear()
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop after the current chunk; unfinished jobs go back on the queue"""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                job = self.queue.claim(self.stale_after)
+            except Exception:
+                logger.exception("Could not claim a job")
+                job = None
+            if job is None:
+                self._stop.wait(self.poll_interval)
+                continue
+
+            try:
+                if run_job(self.queue, job, self.chunk_size, self._stop):
+                    self.queue.finish(job.id)
+                else:
+                    self.queue.requeue(job.id)
+            except Exception as e:
+                logger.exception("Job %s failed", job.id)
+                self.queue.finish(job.id, error=str(e))
+
+
+job_queue = create_job_queue(settings.jobs_queue_url)
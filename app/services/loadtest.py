@@ -0,0 +1,203 @@
+import asyncio
+import itertools
+import json
+import math
+import re
+import time
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+_NUMERIC_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def load_request_log(path: str) -> List[Dict[str, Any]]:
+    """
+    Read a JSONL request log
+
+    Each line is an object with `path` and optionally `method`, `params`,
+    `json` and `headers`. `method` defaults to POST when a JSON body is
+    present, GET otherwise.
+    """
+    entries = []
+    with open(path) as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            entry = json.loads(line)
+            if "path" not in entry:
+                raise ValueError(f"{path}:{line_number}: request has no 'path'")
+            entry.setdefault("method", "POST" if "json" in entry else "GET")
+            entries.append(entry)
+    return entries
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class _Series:
+    """Latencies and outcomes for one endpoint or action"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors: Counter = Counter()
+
+    def summary(self, elapsed: float) -> Dict[str, Any]:
+        latencies = sorted(self.latencies)
+        return {
+            "requests": len(latencies),
+            "throughput": round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p90_ms": round(percentile(latencies, 90) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+            "max_ms": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+            "errors": dict(self.errors),
+        }
+
+
+class LoadTestStats:
+    """Collects results per endpoint and per action"""
+
+    def __init__(self):
+        self.total = _Series()
+        self.endpoints: Dict[str, _Series] = defaultdict(_Series)
+        self.actions: Dict[str, _Series] = defaultdict(_Series)
+        self.elapsed = 0.0
+
+    def record(self, entry: Dict[str, Any], latency: float, outcome: Optional[str]) -> None:
+        """Record one request; outcome is an error label or None on success"""
+        series = [self.total, self.endpoints[endpoint_key(entry)]]
+        action = action_key(entry)
+        if action:
+            series.append(self.actions[action])
+        for s in series:
+            s.latencies.append(latency)
+            if outcome:
+                s.errors[outcome] += 1
+
+    def report(self) -> Dict[str, Any]:
+        return {
+            "elapsed_s": round(self.elapsed, 3),
+            "total": self.total.summary(self.elapsed),
+            "endpoints": {key: s.summary(self.elapsed) for key, s in sorted(self.endpoints.items())},
+            "actions": {key: s.summary(self.elapsed) for key, s in sorted(self.actions.items())},
+        }
+
+
+def endpoint_key(entry: Dict[str, Any]) -> str:
+    """Group requests by method and path with numeric IDs collapsed"""
+    path = entry["path"].split("?", 1)[0]
+    return f"{entry['method'].upper()} {_NUMERIC_SEGMENT.sub('/{id}', path)}"
+
+
+def action_key(entry: Dict[str, Any]) -> Optional[str]:
+    """Identify the platform/action a convert request targets, if any"""
+    body = entry.get("json")
+    if not isinstance(body, dict):
+        return None
+    platform = body.get("platform_slug") or body.get("platform_id")
+    action = body.get("action_slug") or body.get("action_id")
+    if platform is None and action is None:
+        return None
+    return f"{platform}/{action}"
+
+
+async def _send(client: httpx.AsyncClient, entry: Dict[str, Any], stats: LoadTestStats) -> None:
+    started = time.perf_counter()
+    outcome = None
+    try:
+        response = await client.request(
+            entry["method"],
+            entry["path"],
+            params=entry.get("params"),
+            json=entry.get("json"),
+            headers=entry.get("headers"),
+        )
+        await response.aread()
+        if response.status_code >= 400:
+            outcome = str(response.status_code)
+    except httpx.HTTPError as e:
+        outcome = type(e).__name__
+    stats.record(entry, time.perf_counter() - started, outcome)
+
+
+async def run_load_test(
+    entries: List[Dict[str, Any]],
+    base_url: Optional[str] = None,
+    concurrency: int = 10,
+    rate: Optional[float] = None,
+    duration: Optional[float] = None,
+    timeout: float = 30.0,
+) -> LoadTestStats:
+    """
+    Replay request log entries and collect latency statistics
+
+    Without `base_url` requests go to the app in-process over ASGI. `rate`
+    caps requests per second across all workers. With `duration` the log is
+    replayed in a loop until time runs out, otherwise it is replayed once.
+    """
+    if not entries:
+        raise ValueError("Request log is empty")
+
+    stats = LoadTestStats()
+    source: Iterator[Dict[str, Any]] = itertools.cycle(entries) if duration else iter(entries)
+    schedule = itertools.count()
+
+    if base_url:
+        transport, lifespan, url = None, nullcontext(), base_url
+    else:
+        from app.main import app
+        # Unhandled app errors become 500 responses, counted like any other failure
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        lifespan, url = app.router.lifespan_context(app), "http://loadtest"
+
+    async with lifespan:
+        async with httpx.AsyncClient(base_url=url, transport=transport, timeout=timeout) as client:
+            started = time.perf_counter()
+            deadline = started + duration if duration else None
+
+            async def worker() -> None:
+                while True:
+                    entry = next(source, None)
+                    if entry is None:
+                        return
+                    if rate:
+                        # Fixed schedule: request i starts no earlier than i / rate seconds in
+                        delay = started + next(schedule) / rate - time.perf_counter()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    if deadline and time.perf_counter() >= deadline:
+                        return
+                    await _send(client, entry, stats)
+
+            await asyncio.gather(*(worker() for _ in range(concurrency)))
+            stats.elapsed = time.perf_counter() - started
+
+    return stats
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    """Render a load test report as plain-text tables"""
+    header = f"{'':40} {'reqs':>7} {'req/s':>8} {'p50ms':>8} {'p90ms':>8} {'p99ms':>8} {'maxms':>8}  errors"
+
+    def row(name: str, s: Dict[str, Any]) -> str:
+        errors = ", ".join(f"{k}: {v}" for k, v in sorted(s["errors"].items())) or "-"
+        return (
+            f"{name[:40]:40} {s['requests']:>7} {s['throughput']:>8} {s['p50_ms']:>8} "
+            f"{s['p90_ms']:>8} {s['p99_ms']:>8} {s['max_ms']:>8}  {errors}"
+        )
+
+    lines = [f"Elapsed: {report['elapsed_s']}s", "", header, row("TOTAL", report["total"])]
+    for title, key in (("Per endpoint", "endpoints"), ("Per action", "actions")):
+        if report[key]:
+            lines += ["", title]
+            lines += [row(name, s) for name, s in report[key].items()]
+    return "\n".join(lines)
@@ -1,6 +1,7 @@
 from sqlmodel import Session, select
-from app.models import Platform, Action, Variable, Template, VariableType
+from app.models import Platform, Action, Variable, VariableType
 from app.database import engine
+from app.services.templates import publish_template
 
 
 def seed_database():
@@ -214,12 +215,8 @@ Expected outcome: Email sent to {{ recipient }} with subject "{{ subject }}"{% i
                     )
                     session.add(variable)
                 
-                # Create template
-                template = Template(
-                    content=action_data["template"],
-                    action_id=action.id
-                )
-                session.add(template)
+                # Create template as its first published version
+                publish_template(session, action.id, action_data["template"])
         
         session.commit()
         print("Database seeded successfully!")
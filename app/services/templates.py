@@ -0,0 +1,87 @@
+from datetime import datetime, timezone
+from typing import List, Optional
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from app.models import Action, Template, TemplateVersion
+
+# Attempts at a version number before giving up on a contended publish
+PUBLISH_ATTEMPTS = 3
+
+
+def list_template_versions(session: Session, action_id: int) -> List[TemplateVersion]:
+    """List an action's template versions, newest first"""
+    statement = select(TemplateVersion).where(
+        TemplateVersion.action_id == action_id
+    ).order_by(TemplateVersion.version.desc())
+    return list(session.exec(statement).all())
+
+
+def publish_template(session: Session, action_id: int, content: str) -> TemplateVersion:
+    """
+    Store content as a new immutable version and make it the active one
+
+    The version insert and the pointer switch commit in one transaction, so
+    readers see either the previous version or the new one, never a mix.
+    Raises IntegrityError if concurrent publishes keep taking the version number.
+    """
+    for attempt in range(PUBLISH_ATTEMPTS):
+        try:
+            return _publish(session, action_id, content)
+        except IntegrityError:
+            session.rollback()
+            if attempt == PUBLISH_ATTEMPTS - 1:
+                raise
+
+
+def _publish(session: Session, action_id: int, content: str) -> TemplateVersion:
+    # Lock the action row, which exists even before the first publish, so
+    # concurrent publishes get distinct version numbers. Databases without
+    # row locks (SQLite) hit the unique constraint instead and retry.
+    session.exec(select(Action.id).where(Action.id == action_id).with_for_update()).first()
+    template = session.exec(
+        select(Template).where(Template.action_id == action_id)
+    ).first()
+    latest = session.exec(
+        select(func.max(TemplateVersion.version)).where(TemplateVersion.action_id == action_id)
+    ).one()
+
+    version = TemplateVersion(action_id=action_id, version=(latest or 0) + 1, content=content)
+    session.add(version)
+    session.flush()
+
+    if template is None:
+        template = Template(action_id=action_id, content=content)
+    _point_to(template, version)
+    session.add(template)
+    session.commit()
+    session.refresh(version)
+    return version
+
+
+def activate_template_version(session: Session, action_id: int, version_id: int) -> Optional[TemplateVersion]:
+    """Switch the action's active template to an existing version, e.g. to roll back"""
+    version = session.exec(
+        select(TemplateVersion).where(
+            TemplateVersion.id == version_id,
+            TemplateVersion.action_id == action_id
+        )
+    ).first()
+    template = session.exec(
+        select(Template).where(Template.action_id == action_id).with_for_update()
+    ).first()
+    if not version or not template:
+        return None
+
+    _point_to(template, version)
+    session.add(template)
+    session.commit()
+    session.refresh(version)
+    return version
+
+
+def _point_to(template: Template, version: TemplateVersion) -> None:
+    """Make version the active one, mirroring its content for legacy readers"""
+    template.active_version_id = version.id
+    template.content = version.content
+    template.updated_at = datetime.now(timezone.utc)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Catalog memory benchmark
+Compares the memory held by a catalog loaded as ORM instances with the same
+catalog loaded as slotted records (app.core.records)
+
+Usage: python benchmarks/catalog_memory.py [--actions 5000] [--variables 5]
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.models import Platform, Action, Variable, VariableType, TemplateVersion
+from app.core.records import (
+    PlatformRecord, ActionRecord, VariableRecord, TemplateRecord,
+    PLATFORM_COLUMNS, ACTION_COLUMNS, VARIABLE_COLUMNS, TEMPLATE_COLUMNS
+)
+
+TEMPLATE = "You are a web automation agent. Post {{ content }} with privacy {{ privacy }}.\n" * 10
+
+
+def build_catalog(engine, actions: int, variables: int) -> None:
+    """Fill the database with a synthetic catalog"""
+    with Session(engine) as session:
+        platforms = [Platform(name=f"Platform {i}", slug=f"platform-{i}", description="Platform") for i in range(50)]
+        session.add_all(platforms)
+        session.flush()
+        for i in range(actions):
+            action = Action(
+                name="Create Post", slug="post", description="Create a new post",
+                platform_id=platforms[i % len(platforms)].id
+            )
+            session.add(action)
+            session.flush()
+            session.add(TemplateVersion(action_id=action.id, version=1, content=TEMPLATE))
+            for j in range(variables):
+                session.add(Variable(
+                    name=f"var_{j}", label=f"Variable {j}", type=VariableType.SELECT, required=j == 0,
+                    placeholder="Choose one", options=["public", "friends", "only_me"], order=j,
+                    action_id=action.id
+                ))
+        session.commit()
+
+
+def load_orm(engine):
+    session = Session(engine)
+    rows = []
+    for model in (Platform, Action, Variable, TemplateVersion):
+        rows.extend(session.exec(select(model)).all())
+    return session, rows
+
+
+def load_records(engine):
+    with Session(engine) as session:
+        rows = []
+        for columns, record in (
+            (PLATFORM_COLUMNS, PlatformRecord),
+            (ACTION_COLUMNS, ActionRecord),
+            (VARIABLE_COLUMNS, VariableRecord),
+            (TEMPLATE_COLUMNS, TemplateRecord),
+        ):
+            rows.extend(record.from_row(row) for row in session.exec(select(*columns)))
+    return None, rows
+
+
+def measure(loader, engine):
+    """Return (row count, bytes still allocated while the loaded catalog is alive)"""
+    gc.collect()
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    holder, rows = loader(engine)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    if holder is not None:
+        holder.close()
+    return len(rows), retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--actions", type=int, default=5000)
+    parser.add_argument("--variables", type=int, default=5, help="Variables per action")
+    args = parser.parse_args()
+
+    engine = create_engine("sqlite://")
+    SQLModel.metadata.create_all(engine)
+    build_catalog(engine, args.actions, args.variables)
+
+    # Template content is the same size in both representations; report it separately
+    content_bytes = args.actions * sys.getsizeof(TEMPLATE)
+
+    results = {}
+    for name, loader in (("ORM instances", load_orm), ("Slotted records", load_records)):
+        count, retained = measure(loader, engine)
+        results[name] = retained
+        print(
+            f"{name:16} {count:>8} rows  {retained / 1024 / 1024:8.2f} MiB total  "
+            f"{retained / count:8.0f} B/row  {(retained - content_bytes) / count:8.0f} B/row excl. template text"
+        )
+
+    orm, records = results["ORM instances"], results["Slotted records"]
+    print(f"\nReduction: {orm / records:.1f}x overall, {(orm - content_bytes) / (records - content_bytes):.1f}x excluding template text")
+
+
+if __name__ == "__main__":
+    main()
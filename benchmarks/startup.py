@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Worker startup benchmark
+Boots the app in fresh interpreters under each STARTUP_MODE and reports the
+import time, lifespan startup time and SQL statements issued before the
+worker is ready. Uses the database configured in the environment / .env.
+
+Usage: python benchmarks/startup.py [--runs 5] [--modes development,production]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in a fresh interpreter so module imports are not already cached
+CHILD = """
+import asyncio, json, time
+start = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+from sqlalchemy import event
+from app.database import engine
+statements = []
+event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+async def boot():
+    async with app.router.lifespan_context(app):
+        return time.perf_counter()
+
+ready = asyncio.run(boot())
+print(json.dumps({"import": imported - start, "startup": ready - imported, "statements": len(statements)}))
+"""
+
+
+def boot_once(mode: str) -> dict:
+    env = dict(os.environ, STARTUP_MODE=mode)
+    result = subprocess.run([sys.executable, "-c", CHILD], cwd=ROOT, env=env, capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.exit(f"{mode} startup failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--modes", default="development,production")
+    args = parser.parse_args()
+
+    print(f"{'mode':12} {'import':>10} {'startup':>10} {'total':>10} {'SQL':>5}")
+    for mode in args.modes.split(","):
+        runs = [boot_once(mode) for _ in range(args.runs)]
+        imported = statistics.median(run["import"] for run in runs) * 1000
+        startup = statistics.median(run["startup"] for run in runs) * 1000
+        statements = max(run["statements"] for run in runs)
+        print(f"{mode:12} {imported:8.1f}ms {startup:8.1f}ms {imported + startup:8.1f}ms {statements:5}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Statement registry benchmark
+Compares the per-query cost of building a select() on every call with
+executing the prebuilt statements in app.core.statements
+
+Usage: python benchmarks/statement_cache.py [--iterations 5000] [--database-url sqlite://]
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from app.core import statements
+from app.core.records import PLATFORM_COLUMNS, ACTION_COLUMNS, VARIABLE_COLUMNS, TEMPLATE_COLUMNS
+from app.models import Platform, Action, Variable, VariableType, Template, TemplateVersion
+
+
+def build_catalog(engine) -> None:
+    """Fill the database with one platform, action, template and a few variables"""
+    with Session(engine) as session:
+        platform = Platform(name="Instagram", slug="instagram", description="Platform")
+        session.add(platform)
+        session.flush()
+        action = Action(name="Create Post", slug="post", description="Create a new post", platform_id=platform.id)
+        session.add(action)
+        session.flush()
+        version = TemplateVersion(action_id=action.id, version=1, content="Post {{ content }}")
+        session.add(version)
+        session.flush()
+        session.add(Template(action_id=action.id, content=version.content, active_version_id=version.id))
+        for j in range(5):
+            session.add(Variable(
+                name=f"var_{j}", label=f"Variable {j}", type=VariableType.TEXT, order=j, action_id=action.id
+            ))
+        session.commit()
+
+
+# (name, statement built per call as before, registered statement, parameters)
+QUERIES = [
+    (
+        "platform by id",
+        lambda id: select(*PLATFORM_COLUMNS).where(Platform.id == id),
+        statements.PLATFORM_BY_ID, "platform_id"
+    ),
+    (
+        "action by id",
+        lambda id: select(*ACTION_COLUMNS).where(Action.id == id),
+        statements.ACTION_BY_ID, "action_id"
+    ),
+    (
+        "variables by action",
+        lambda id: select(*VARIABLE_COLUMNS).where(Variable.action_id == id).order_by(Variable.order, Variable.id),
+        statements.VARIABLES_BY_ACTION, "action_id"
+    ),
+    (
+        "active template",
+        lambda id: select(*TEMPLATE_COLUMNS).join(
+            Template, Template.active_version_id == TemplateVersion.id
+        ).where(Template.action_id == id, Template.is_active == True),
+        statements.ACTIVE_TEMPLATE_BY_ACTION, "action_id"
+    ),
+]
+
+
+def per_query(run, iterations: int) -> float:
+    """Return microseconds per call after a warm-up"""
+    for _ in range(min(iterations, 200)):
+        run()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        run()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument(
+        "--database-url", default="sqlite://",
+        help="Database to query; anything but the default must already be migrated and seeded"
+    )
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if args.database_url == "sqlite://":
+        SQLModel.metadata.create_all(engine)
+        build_catalog(engine)
+
+    print(f"{'query':20} {'rebuilt':>10} {'registry':>10} {'saved':>10}")
+    with engine.connect() as connection:
+        for name, build, statement, param in QUERIES:
+            rebuilt = per_query(lambda: connection.execute(build(1)).all(), args.iterations)
+            registry = per_query(lambda: connection.execute(statement, {param: 1}).all(), args.iterations)
+            print(f"{name:20} {rebuilt:8.1f}us {registry:8.1f}us {rebuilt - registry:8.1f}us")
+
+
+if __name__ == "__main__":
+    main()
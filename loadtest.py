@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Load test runner
+Replays a JSONL request log against the app in-process or against a running server
+"""
+import argparse
+import asyncio
+import json
+
+from app.services.loadtest import format_report, load_request_log, run_load_test
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("log", help="JSONL request log to replay")
+    parser.add_argument("--url", help="Base URL of a running server (default: in-process over ASGI)")
+    parser.add_argument("--concurrency", type=int, default=10, help="Concurrent requests (default: 10)")
+    parser.add_argument("--rate", type=float, help="Maximum requests per second (default: unlimited)")
+    parser.add_argument("--duration", type=float, help="Loop over the log for this many seconds (default: one pass)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Per-request timeout in seconds")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    entries = load_request_log(args.log)
+    stats = asyncio.run(run_load_test(
+        entries,
+        base_url=args.url,
+        concurrency=args.concurrency,
+        rate=args.rate,
+        duration=args.duration,
+        timeout=args.timeout,
+    ))
+
+    report = stats.report()
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Background job worker
+Runs bulk conversion jobs from the job queue outside the API processes.
+Set JOBS_WORKERS=0 for the API when conversions should only run here.
+
+Usage: python worker.py [--workers 4]
+"""
+import argparse
+import signal
+import threading
+
+from app.config import settings
+from app.database import engine, read_router
+from app.services.catalog_listener import CatalogListener
+from app.services.conversion_log import conversion_log
+from app.services.jobs import JobWorkerPool, job_queue
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=max(settings.jobs_workers, 1), help="Worker threads")
+    args = parser.parse_args()
+
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stopped.set())
+
+    read_router.start()
+    # Jobs must render the active template version, so evict cached catalog entries on publish
+    listener = None
+    if settings.catalog_listener_enabled and engine.dialect.name == "postgresql":
+        listener = CatalogListener(engine, settings.catalog_version_check_interval)
+        listener.start()
+    if settings.conversion_log_enabled:
+        conversion_log.start()
+    pool = JobWorkerPool(job_queue, args.workers, settings.jobs_chunk_size, settings.jobs_stale_after)
+    pool.start()
+    print(f"Running {args.workers} job workers, Ctrl-C to stop")
+    try:
+        stopped.wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        # Unfinished jobs go back on the queue for the next worker
+        pool.stop()
+        conversion_log.stop()
+        read_router.stop()
+        if listener is not None:
+            listener.stop()
+
+
+if __name__ == "__main__":
+    main()